@@ -4,18 +4,29 @@
 slack_webhook.py의 send_digest를 crewAI Tool로 래핑하여 사용한다.
 """
 
-import json
 import logging
+import threading
 
 from crewai import Agent
 from crewai.tools import BaseTool
-from pydantic import Field, ValidationError
+from pydantic import Field, TypeAdapter, ValidationError
 
 from src.schemas.slack import DigestBlock, SlackConfig
 from src.tools.slack_webhook import send_digest
 
 logger = logging.getLogger(__name__)
 
+# JSON 파싱 + 리스트 검증을 pydantic-core 한 번의 호출로 처리하기 위한
+# 모듈 레벨 어댑터. 블록마다 DigestBlock(**block)을 호출하는 것보다
+# 중간 리스트/딕셔너리 생성과 검증 진입 오버헤드가 적다.
+_BLOCKS_ADAPTER = TypeAdapter(list[DigestBlock])
+
+# Agent 인스턴스 캐시: (채널, webhook 해시) → Agent
+# crewAI Agent/Tool 생성은 Pydantic 모델 초기화 비용이 크므로
+# 동일 설정으로 반복 호출 시 재사용한다. Lock은 멀티스레드 kickoff 대비.
+_AGENT_CACHE: dict[tuple[str, int], Agent] = {}
+_AGENT_CACHE_LOCK = threading.Lock()
+
 
 class SendDigestTool(BaseTool):
     """Slack으로 다이제스트 메시지를 발송하는 crewAI Tool.
@@ -46,7 +57,8 @@ class SendDigestTool(BaseTool):
         """다이제스트 블록을 Slack으로 발송한다.
 
         crewAI Agent는 인자를 문자열로 전달하므로
-        JSON 파싱 후 DigestBlock 리스트로 변환한다.
+        TypeAdapter로 JSON 파싱과 DigestBlock 리스트 검증을
+        한 번에 수행한다.
 
         모든 예외를 내부에서 catch하여 실패 메시지 문자열로 반환하므로
         호출자에게 예외가 전파되지 않는다.
@@ -58,16 +70,19 @@ class SendDigestTool(BaseTool):
         Returns:
             발송 성공/실패 메시지 문자열.
         """
+        # 빈 LLM 출력은 파싱/검증/HTTP 왕복 없이 즉시 반환
+        stripped = blocks_json.strip()
+        if not stripped or stripped in ("[]", "null"):
+            logger.info("발송할 블록 없음 — 발송 생략")
+            return "발송 생략: 빈 블록"
+
         try:
-            # crewAI Agent가 전달한 JSON 문자열을 파싱
-            raw_blocks = json.loads(blocks_json)
-            blocks = [DigestBlock(**block) for block in raw_blocks]
+            # JSON 파싱 + 리스트 검증을 pydantic-core에서 한 번에 수행
+            # (잘못된 JSON도 ValidationError로 보고된다)
+            blocks = _BLOCKS_ADAPTER.validate_json(stripped)
 
             send_digest(blocks, self.config)
             return "다이제스트 발송 성공"
-        except json.JSONDecodeError as e:
-            logger.error("블록 JSON 파싱 실패: %s", e)
-            return f"발송 실패: JSON 파싱 오류 - {e}"
         except ValidationError as e:
             logger.error("블록 유효성 검증 실패: %s", e)
             return f"발송 실패: 데이터 검증 오류 - {e}"
@@ -81,6 +96,33 @@ def create_publisher_agent(config: SlackConfig) -> Agent:
 
     다이제스트 콘텐츠를 수집하여 Slack으로 발송하는 역할을 담당하는
     crewAI Agent를 구성하여 반환한다.
+    동일한 설정으로 재호출하면 캐시된 Agent를 재사용하며,
+    채널 또는 webhook URL이 바뀌면 새로 생성한다.
+
+    Args:
+        config: Slack 연동 설정값.
+
+    Returns:
+        Agent: 구성 완료된 crewAI Agent 인스턴스.
+    """
+    # 설정이 바뀌면 캐시가 무효화되도록 식별 가능한 필드로 키를 만든다
+    cache_key = (
+        config.channel,
+        hash(config.webhook_url.get_secret_value()),
+    )
+
+    with _AGENT_CACHE_LOCK:
+        cached = _AGENT_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        agent = _build_publisher_agent(config)
+        _AGENT_CACHE[cache_key] = agent
+        return agent
+
+
+def _build_publisher_agent(config: SlackConfig) -> Agent:
+    """퍼블리셔 Agent 인스턴스를 실제로 구성한다.
 
     Args:
         config: Slack 연동 설정값.
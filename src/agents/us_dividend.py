@@ -6,15 +6,44 @@ DividendService를 crewAI Tool로 래핑하여 사용한다.
 """
 
 import logging
+import threading
+import time
 
 from crewai import Agent
 from crewai.tools import BaseTool
 from pydantic import Field
 
+from src.schemas.stock import DividendScanResult
 from src.services.dividend_service import DividendService
 
 logger = logging.getLogger(__name__)
 
+# 스캔 결과 TTL 캐시: scan_days → (저장 시각, 스캔 결과)
+# Agent가 한 turn에서 도구를 여러 번 호출해도 Yahoo Finance를
+# 다시 치지 않도록 최근 결과를 재사용한다.
+_SCAN_CACHE: dict[int, tuple[float, DividendScanResult]] = {}
+
+# 왜 10분인가: 배당락일 데이터는 장중에도 거의 변하지 않으므로
+# crew 실행 1회(수 분) 동안 재사용해도 안전한 수준이다.
+_SCAN_CACHE_TTL = 600.0
+
+# 빈 결과는 짧게 캐시: 장외 시간에 yfinance를 반복 호출하는 것은 막되,
+# 데이터가 새로 생기면 비교적 빨리 반영되도록 한다.
+_SCAN_CACHE_EMPTY_TTL = 120.0
+
+# 종목 1줄 포맷 템플릿: 포맷 스펙 파싱을 모듈 로드 시 1회로 상각하고,
+# map(템플릿.format, ...)으로 루프 본문을 C 레벨에서 돌린다.
+_STOCK_LINE_TEMPLATE = (
+    "  - {0.ticker} ({0.company_name}): "
+    "수익률 {0.dividend_yield:.1f}%, "
+    "배당락일 {0.ex_dividend_date}"
+)
+
+# Agent 싱글턴 캐시: 설정 인자가 없으므로 인스턴스 1개면 충분하다.
+# crewAI Agent/Tool 생성의 Pydantic 초기화 비용을 반복 지불하지 않는다.
+_CACHED_AGENT: Agent | None = None
+_AGENT_LOCK = threading.Lock()
+
 
 class ScanDividendsTool(BaseTool):
     """배당락일 임박 종목을 스캔하는 crewAI Tool.
@@ -49,6 +78,8 @@ class ScanDividendsTool(BaseTool):
 
         crewAI Agent는 도구 실행 결과를 문자열로 받으므로
         스캔 결과를 읽기 쉬운 형태로 포맷팅하여 반환한다.
+        TTL 이내의 반복 호출은 캐시된 결과를 재사용하여
+        Yahoo Finance 재호출을 방지한다.
 
         모든 예외를 내부에서 catch하여 실패 메시지를 반환하므로
         호출자에게 예외가 전파되지 않는다.
@@ -60,32 +91,56 @@ class ScanDividendsTool(BaseTool):
             스캔 결과 문자열.
         """
         try:
-            service = DividendService(scan_days=self.scan_days)
-            result = service.scan_dividends()
+            result = self._scan_with_cache()
 
             if not result.stocks:
                 return f"향후 {self.scan_days}일 이내 배당락일 임박 종목 없음"
 
-            lines = [
-                f"배당락일 임박 종목 ({len(result.stocks)}개):"
-            ]
-            for stock in result.stocks:
-                lines.append(
-                    f"  - {stock.ticker} ({stock.company_name}): "
-                    f"수익률 {stock.dividend_yield:.1f}%, "
-                    f"배당락일 {stock.ex_dividend_date}"
-                )
-            return "\n".join(lines)
+            # 사전 컴파일된 템플릿 + map: 포맷 스펙 재파싱 없이
+            # 최종 문자열 1회 할당으로 합친다
+            header = f"배당락일 임박 종목 ({len(result.stocks)}개):"
+            body = "\n".join(
+                map(_STOCK_LINE_TEMPLATE.format, result.stocks)
+            )
+            return f"{header}\n{body}"
         except (ConnectionError, ValueError, TypeError, OSError) as e:
             logger.error("배당 스캔 도구 실행 실패: %s", e)
             return f"스캔 실패: {e}"
 
+    def _scan_with_cache(self) -> DividendScanResult:
+        """TTL 캐시를 거쳐 배당 스캔을 실행한다.
+
+        캐시 키는 scan_days이며, 빈 결과는 더 짧은 TTL을 적용한다.
+
+        Returns:
+            DividendScanResult: 캐시된 또는 새로 스캔한 결과.
+        """
+        entry = _SCAN_CACHE.get(self.scan_days)
+        if entry is not None:
+            cached_at, cached_result = entry
+            ttl = (
+                _SCAN_CACHE_TTL
+                if cached_result.stocks
+                else _SCAN_CACHE_EMPTY_TTL
+            )
+            if time.monotonic() - cached_at < ttl:
+                logger.info(
+                    "배당 스캔 캐시 재사용 (scan_days=%d)", self.scan_days,
+                )
+                return cached_result
+
+        service = DividendService(scan_days=self.scan_days)
+        result = service.scan_dividends()
+        _SCAN_CACHE[self.scan_days] = (time.monotonic(), result)
+        return result
+
 
 def create_us_dividend_agent() -> Agent:
     """미국 고배당주 스캐너 Agent를 생성한다.
 
     배당락일 임박 종목을 스캔하여 투자 정보를 수집하는
     crewAI Agent를 구성하여 반환한다.
+    최초 1회만 생성하며 이후 호출은 캐시된 인스턴스를 재사용한다.
 
     Returns:
         Agent: 구성 완료된 crewAI Agent 인스턴스.
@@ -93,6 +148,20 @@ def create_us_dividend_agent() -> Agent:
     Raises:
         ValueError: crewAI에 LLM 설정이 누락된 경우.
     """
+    global _CACHED_AGENT
+
+    with _AGENT_LOCK:
+        if _CACHED_AGENT is None:
+            _CACHED_AGENT = _build_us_dividend_agent()
+        return _CACHED_AGENT
+
+
+def _build_us_dividend_agent() -> Agent:
+    """미국 고배당주 스캐너 Agent 인스턴스를 실제로 구성한다.
+
+    Returns:
+        Agent: 구성 완료된 crewAI Agent 인스턴스.
+    """
     tool = ScanDividendsTool()
 
     return Agent(
@@ -9,7 +9,7 @@ crewAI Agent(us_dividend + publisher)를 조합하며,
 import logging
 from typing import Any
 
-from src.schemas.slack import SlackConfig
+from src.schemas.slack import SlackConfig, get_slack_config
 from src.services.slack_service import SlackService
 
 logger = logging.getLogger(__name__)
@@ -110,7 +110,8 @@ if __name__ == "__main__":
 
     logging.basicConfig(level=logging.INFO)
 
-    config = SlackConfig()  # type: ignore[call-arg]
+    # 싱글턴 설정 재사용 (.env 재파싱 방지)
+    config = get_slack_config()
 
     # Agent 정보 출력 (LLM 미설정 시 스킵)
     agents = get_crew_agents(config)
@@ -7,10 +7,11 @@ Pydantic 모델로 타입 안전하게 관리한다.
 
 from __future__ import annotations
 
+import functools
 from datetime import datetime
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, TypeAdapter
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -50,6 +51,19 @@ class SlackConfig(BaseSettings):
     )
 
 
+@functools.lru_cache(maxsize=1)
+def get_slack_config() -> SlackConfig:
+    """환경변수에서 로드한 SlackConfig 싱글턴을 반환한다.
+
+    BaseSettings 생성은 .env 파일 I/O와 환경변수 순회를 수반하므로
+    최초 1회만 파싱하고 이후 호출은 캐시된 인스턴스를 재사용한다.
+
+    Returns:
+        SlackConfig: 환경변수에서 로드된 설정 인스턴스.
+    """
+    return SlackConfig()  # type: ignore[call-arg]
+
+
 class TextObject(BaseModel):
     """Block Kit의 텍스트 오브젝트.
 
@@ -61,6 +75,10 @@ class TextObject(BaseModel):
         text: 실제 텍스트 내용.
     """
 
+    # 생성 후 수정할 일이 없는 값 객체이므로 불변으로 고정한다
+    # (인스턴스 축소 + 실수로 인한 in-place 변형 방지)
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["mrkdwn", "plain_text"] = Field(
         default="mrkdwn",
         description="텍스트 렌더링 타입 (mrkdwn 또는 plain_text)",
@@ -81,6 +99,8 @@ class ButtonElement(BaseModel):
         style: 버튼 스타일 (primary/danger, 선택적).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["button"] = Field(
         default="button",
         description="요소 타입 (항상 button)",
@@ -108,6 +128,8 @@ class DigestBlock(BaseModel):
         elements: 인터랙티브 요소 목록 (actions 블록에서 사용).
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: Literal["section", "header", "divider", "actions"] = Field(
         description="블록 타입 (section, header, divider, actions)"
     )
@@ -124,6 +146,22 @@ class DigestBlock(BaseModel):
         description="인터랙티브 요소 목록 (actions 블록에서 사용)",
     )
 
+    @classmethod
+    def unchecked(cls, **fields: Any) -> DigestBlock:
+        """검증 없이 블록을 생성한다 (내부 신뢰 경로 전용).
+
+        하드코딩된 문자열 등 이미 형태가 보장된 내부 데이터로
+        블록을 만들 때 pydantic 검증 비용을 생략한다.
+        LLM 등 외부에서 온 데이터에는 반드시 일반 생성자를 사용할 것.
+
+        Args:
+            **fields: DigestBlock 필드 값들.
+
+        Returns:
+            DigestBlock: 검증을 거치지 않은 인스턴스.
+        """
+        return cls.model_construct(**fields)
+
     def to_slack_dict(self) -> dict[str, Any]:
         """Slack API 전송용 dict로 변환한다.
 
@@ -133,7 +171,12 @@ class DigestBlock(BaseModel):
         Returns:
             dict[str, Any]: Slack API 전송용 딕셔너리.
         """
-        return self.model_dump(exclude_none=True)
+        return _DIGEST_BLOCK_ADAPTER.dump_python(self, exclude_none=True)
+
+
+# 직렬화 플랜을 1회만 구성해 두는 모듈 레벨 어댑터.
+# to_slack_dict가 블록마다 model_dump 내부 walker를 재구성하지 않도록 한다.
+_DIGEST_BLOCK_ADAPTER = TypeAdapter(DigestBlock)
 
 
 class DigestResult(BaseModel):
@@ -136,6 +136,9 @@ class DividendStock(BaseModel):
         profit_analysis: 세후 수익성 분석 결과 (분석 전 None).
     """
 
+    # indicators/risk/profit_analysis는 스캔 파이프라인의 핫 루프에서
+    # in-place로 채워진다. validate_assignment(기본 False)를 켜면
+    # 이 쓰기마다 검증 비용이 붙으므로 켜지 말 것.
     ticker: str = Field(description="종목 심볼 (예: AAPL, JNJ)")
     company_name: str = Field(description="회사명 (예: Apple Inc.)")
     ex_dividend_date: date = Field(description="배당락일 (ex-dividend date)")
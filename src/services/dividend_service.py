@@ -7,11 +7,16 @@ tools/yahoo_finance.py의 원시 데이터를 가공하여
 의미 있는 결과로 변환한다.
 """
 
-import calendar
+import functools
 import logging
+import threading
+import time
 from datetime import date, timedelta
 from typing import Any
 
+import numpy as np
+from cachetools import TTLCache
+
 from src.schemas.slack import DigestBlock, TextObject
 from src.schemas.stock import (
     DividendProfitAnalysis,
@@ -20,7 +25,10 @@ from src.schemas.stock import (
     RiskAssessment,
     TechnicalIndicators,
 )
-from src.tools.yahoo_finance import get_technical_indicators, get_upcoming_dividends
+from src.tools.yahoo_finance import (
+    get_technical_indicators_batch,
+    get_upcoming_dividends,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +41,11 @@ MIN_DIVIDEND_YIELD_PCT = 3.0
 # 배당 지속 가능성이 높다.
 MIN_MARKET_CAP_USD = 1_000_000_000
 
+# 로그용 천 단위 구분 표기
+# (%-스타일 인자는 지연 평가되지만 f-string 인자는 호출마다 즉시
+# 포맷되므로, 상수는 모듈 로드 시 한 번만 렌더링해 둔다)
+_MIN_MARKET_CAP_STR = f"{MIN_MARKET_CAP_USD:,}"
+
 # 왜 10개인가: Slack 메시지의 가독성을 위해
 # 과도한 종목 수를 제한한다.
 MAX_STOCKS = 10
@@ -40,22 +53,82 @@ MAX_STOCKS = 10
 # 기본 스캔 범위 (일) - scan_days 오버라이드 시 사용
 DEFAULT_SCAN_DAYS = 5
 
-# Yahoo Finance URL 서식
-_YAHOO_URL_TEMPLATE = "<https://finance.yahoo.com/quote/{ticker}|{ticker}>"
+# 요일 이름 (weekday() 값으로 인덱싱)
+# calendar.day_name은 구독할 때마다 로캘 지연 변환을 거치므로
+# 로깅용 영문 이름을 고정 튜플로 둔다
+_DAY_NAMES: tuple[str, ...] = (
+    "Monday", "Tuesday", "Wednesday", "Thursday",
+    "Friday", "Saturday", "Sunday",
+)
 
-# 요일별 스캔 확장 일수
+# 리스크 레벨 → Slack 이모지 (호출마다 dict 리터럴을 만들지 않도록 모듈 레벨)
+_RISK_EMOJI: dict[str, str] = {
+    "LOW": ":large_green_circle:",
+    "MEDIUM": ":large_yellow_circle:",
+    "HIGH": ":red_circle:",
+}
+
+# 요일별 스캔 확장 기간 (weekday() 값으로 인덱싱)
 # 왜 요일별로 다른가: 주말은 거래일이 아니므로,
 # "배당락일까지 최소 영업일 4일 이상 남은 종목"을 놓치지 않기 위해
 # 목/금에는 주말을 건너뛰어 범위를 더 확장한다.
-_WEEKDAY_SCAN_DAYS: dict[int, int] = {
-    0: 4,  # 월(Mon): +4일 → 금요일 (4영업일, 주말 미포함)
-    1: 4,  # 화(Tue): +4일 → 토요일 (4영업일, 주말 포함)
-    2: 4,  # 수(Wed): +4일 → 일요일 (4영업일, 주말 포함)
-    3: 5,  # 목(Thu): +5일 → 화요일 (주말 포함)
-    4: 5,  # 금(Fri): +5일 → 수요일 (주말 포함)
-    5: 6,  # 토(Sat): +6일 → 금요일 (다음 월요일 기준 4영업일)
-    6: 5,  # 일(Sun): +5일 → 금요일 (다음 월요일 기준 4영업일)
-}
+# timedelta를 모듈 로드 시 미리 만들어 두어 호출마다의
+# 딕셔너리 해싱 + timedelta 생성 비용을 없앤다.
+# 순서: 월 +4일(금), 화 +4일(토), 수 +4일(일),
+#       목 +5일(화), 금 +5일(수), 토 +6일(금), 일 +5일(금)
+_WEEKDAY_SCAN_DELTAS: tuple[timedelta, ...] = tuple(
+    timedelta(days=d) for d in (4, 4, 4, 5, 5, 6, 5)
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _scan_range(today: date) -> tuple[date, date]:
+    """기준 날짜의 스캔 범위를 계산한다 (날짜별 LRU 캐시).
+
+    순수 함수이므로 같은 날짜로 반복 호출되는 스캔/테스트/__main__
+    경로에서 캐시된 튜플을 재사용한다.
+
+    Args:
+        today: 기준 날짜.
+
+    Returns:
+        tuple[date, date]: (스캔 시작일, 스캔 종료일).
+    """
+    return (today, today + _WEEKDAY_SCAN_DELTAS[today.weekday()])
+
+
+def _retry_io(fn: Any, *args: Any, **kwargs: Any) -> Any:
+    """일시적 네트워크 오류에 지수 백오프로 재시도한다.
+
+    Yahoo의 간헐적 429/503 한 번으로 전체 스캔 결과가 버려지지
+    않도록, 아웃바운드 호출을 최대 _RETRY_TRIES회 시도한다.
+    마지막 시도까지 실패하면 예외를 그대로 전파한다.
+
+    Args:
+        fn: 호출할 함수.
+        *args: fn에 전달할 위치 인자.
+        **kwargs: fn에 전달할 키워드 인자.
+
+    Returns:
+        fn의 반환값.
+
+    Raises:
+        ConnectionError: 모든 재시도 실패 시.
+        OSError: 모든 재시도 실패 시.
+    """
+    for attempt in range(_RETRY_TRIES):
+        try:
+            return fn(*args, **kwargs)
+        except (ConnectionError, OSError) as e:
+            if attempt == _RETRY_TRIES - 1:
+                raise
+            delay = _RETRY_BASE_DELAY_SEC * (2 ** attempt)
+            logger.warning(
+                "%s 일시 오류, %.1f초 후 재시도 (%d/%d): %s",
+                getattr(fn, "__name__", fn), delay,
+                attempt + 1, _RETRY_TRIES - 1, e,
+            )
+            time.sleep(delay)
 
 # --- 위험도 판단 임계값 상수 ---
 # 왜 RSI 75인가: 전통적 과매수 기준(70)보다 약간 높게 설정.
@@ -99,6 +172,148 @@ _VOLATILITY_FACTOR_CAP = 0.5
 # ±0.3% 내의 순수익률은 사실상 손익분기로 봐야 한다.
 _BREAKEVEN_THRESHOLD = 0.3
 
+# 원시 배당 dict에서 기본값 없이 반드시 존재해야 하는 키
+# 왜 명시 확인인가: model_construct는 검증을 생략하므로 누락된 필드가
+# 스캔 후반에 AttributeError로 터진다. 여기서 KeyError로 걸러
+# 기존 건너뛰기 경로(except KeyError)를 태워야 한다.
+_REQUIRED_STOCK_KEYS = frozenset(
+    {"ticker", "company_name", "ex_dividend_date", "yahoo_finance_url"}
+)
+
+# 원시 배당 dict의 수치 필드 기본값
+# (행마다 item.get(키, 기본값)을 반복하는 대신 머지 1회로 채운다)
+_STOCK_DEFAULTS: dict[str, Any] = {
+    "dividend_yield": 0.0,
+    "dividend_amount": 0.0,
+    "market_cap": 0,
+    "current_price": 0.0,
+    "last_dividend_value": 0.0,
+}
+
+# --- 외부 호출 재시도 상수 ---
+# 왜 3회/0.4초인가: Yahoo의 일시적 429/503은 대부분 1초 내에 해소되므로
+# 0.4 → 0.8초 백오프 2회면 충분하고, 총 대기도 스캔 지연 허용 범위다.
+_RETRY_TRIES = 3
+_RETRY_BASE_DELAY_SEC = 0.4
+
+# 스캔 결과 TTL 캐시: (기준 날짜, scan_days 오버라이드) → DividendScanResult
+# 왜 캐시하나: Slack "다시 실행" 버튼 등으로 같은 날 스캔이 반복 호출되면
+# 동일한 Yahoo 데이터를 다시 내려받게 된다. 첫 호출만 네트워크 비용을
+# 지불하고 이후 호출은 즉시 반환한다.
+# 왜 1시간인가: 도구 계층의 배당/지표 캐시 TTL과 맞추어,
+# 장중 가격 변동이 한 시간 이상 낡은 결과로 보이지 않게 한다.
+_SCAN_CACHE: TTLCache = TTLCache(maxsize=16, ttl=3600)
+
+# cachetools 캐시는 스레드 안전하지 않다 (조회도 만료 리스트를 변형한다).
+# Bolt 실행기(워커 4개)와 asyncio.to_thread가 run_digest를 동시에 돌릴 수
+# 있으므로 get/set을 락으로 감싼다.
+_SCAN_CACHE_LOCK = threading.Lock()
+
+
+class DividendScanArrays:
+    """배당 종목 수치 컬럼의 SoA(Struct-of-Arrays) 표현.
+
+    필터링에 쓰이는 수치 필드만 numpy 배열로 뽑아 보관하여,
+    종목별 Pydantic 속성 접근 대신 배열 단위 벡터 연산으로
+    마스크를 계산할 수 있게 한다.
+    원본 DividendStock 리스트는 함께 보관하여 마스크 적용 시
+    살아남은 종목만 그대로 되돌려 준다.
+
+    Attributes:
+        stocks: 원본 종목 리스트 (마스크 적용 대상).
+        yields: 배당수익률 (%) float64 배열.
+        market_caps: 시가총액 (USD) float64 배열.
+    """
+
+    def __init__(
+        self,
+        stocks: list[DividendStock],
+        yields: np.ndarray,
+        market_caps: np.ndarray,
+    ) -> None:
+        """DividendScanArrays를 초기화한다.
+
+        Args:
+            stocks: 원본 종목 리스트.
+            yields: 배당수익률 배열 (stocks와 같은 순서).
+            market_caps: 시가총액 배열 (stocks와 같은 순서).
+        """
+        self.stocks = stocks
+        self.yields = yields
+        self.market_caps = market_caps
+
+    @classmethod
+    def from_stocks(
+        cls, stocks: list[DividendStock]
+    ) -> "DividendScanArrays":
+        """DividendStock 리스트(AoS)에서 SoA 컬럼을 구성한다.
+
+        Args:
+            stocks: 변환할 종목 리스트.
+
+        Returns:
+            DividendScanArrays: 수치 컬럼이 채워진 SoA 인스턴스.
+        """
+        count = len(stocks)
+        yields = np.fromiter(
+            (s.dividend_yield for s in stocks),
+            dtype=np.float64, count=count,
+        )
+        market_caps = np.fromiter(
+            (s.market_cap for s in stocks),
+            dtype=np.float64, count=count,
+        )
+        return cls(stocks, yields, market_caps)
+
+    def to_stocks(self, mask: np.ndarray) -> list[DividendStock]:
+        """불리언 마스크를 적용하여 종목 리스트로 되돌린다.
+
+        Args:
+            mask: stocks와 같은 길이의 불리언 배열.
+
+        Returns:
+            list[DividendStock]: 마스크가 True인 종목만 포함.
+        """
+        return [s for s, keep in zip(self.stocks, mask) if keep]
+
+    def filter_mask(self) -> np.ndarray:
+        """기본 필터(배당수익률, 시가총액) 마스크를 계산한다.
+
+        Returns:
+            np.ndarray: stocks와 같은 길이의 통과 여부 불리언 배열.
+        """
+        return (
+            (self.yields >= MIN_DIVIDEND_YIELD_PCT)
+            & (self.market_caps >= MIN_MARKET_CAP_USD)
+        )
+
+    def top_by_yield(
+        self, mask: np.ndarray, k: int
+    ) -> list[DividendStock]:
+        """마스크 통과 종목 중 배당수익률 상위 k개를 반환한다.
+
+        전체 정렬 대신 argpartition으로 상위 k개만 골라낸 뒤
+        그 k개만 정렬한다 (O(N + k log k)). 선택과 정렬이 모두
+        numpy 배열 위에서 끝나므로 종목별 속성 접근 비교 함수를
+        한 번도 호출하지 않는다.
+
+        Args:
+            mask: stocks와 같은 길이의 불리언 배열.
+            k: 선택할 최대 종목 수.
+
+        Returns:
+            list[DividendStock]: 배당수익률 내림차순 상위 k개 종목.
+        """
+        indices = np.flatnonzero(mask)
+        if indices.size > k:
+            # argpartition은 상위 k개를 끝쪽에 모으기만 한다 (O(N))
+            top = np.argpartition(self.yields[indices], -k)[-k:]
+            indices = indices[top]
+        # 남은 k개만 내림차순 정렬
+        order = np.argsort(self.yields[indices])[::-1]
+        stocks = self.stocks
+        return [stocks[i] for i in indices[order]]
+
 
 class DividendService:
     """미국 주식 배당락일 스캔 및 포맷팅 서비스.
@@ -137,10 +352,7 @@ class DividendService:
         Returns:
             tuple[date, date]: (스캔 시작일, 스캔 종료일).
         """
-        weekday = today.weekday()
-        days_ahead = _WEEKDAY_SCAN_DAYS[weekday]
-        end_date = today + timedelta(days=days_ahead)
-        return (today, end_date)
+        return _scan_range(today)
 
     def scan_dividends(self) -> DividendScanResult:
         """배당락일 임박 종목을 스캔하고 필터링한다.
@@ -157,6 +369,15 @@ class DividendService:
         """
         today = date.today()
 
+        # 같은 날 + 같은 오버라이드로 이미 스캔했다면 캐시를 재사용한다
+        # (Slack 재실행 버튼 등 반복 호출 경로의 체감 지연을 제거)
+        cache_key = (today, self._scan_days_override)
+        with _SCAN_CACHE_LOCK:
+            cached = _SCAN_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("캐시된 스캔 결과 재사용: %s", cache_key)
+            return cached
+
         # 수동 오버라이드가 있으면 고정 범위, 없으면 요일별 동적 계산
         if self._scan_days_override is not None:
             start_date = today
@@ -165,7 +386,7 @@ class DividendService:
             start_date, end_date = self.calculate_scan_range(today)
 
         scan_range_days = (end_date - start_date).days
-        day_name = calendar.day_name[today.weekday()]
+        day_name = _DAY_NAMES[today.weekday()]
 
         logger.info(
             "오늘: %s(%s), 스캔 범위: %s ~ %s (%d일)",
@@ -181,45 +402,42 @@ class DividendService:
         high_risk_excluded = 0
 
         try:
-            raw_data = get_upcoming_dividends(
+            raw_data = _retry_io(
+                get_upcoming_dividends,
                 start_date=start_date, end_date=end_date,
             )
             stocks = self._parse_raw_data(raw_data)
 
             logger.info(
-                "필터링 전 종목 수: %d, 필터 조건: yield >= %.1f%%, "
-                "market_cap >= $%s",
+                "기본 필터 통과 종목 수: %d (yield >= %.1f%%, "
+                "market_cap >= $%s)",
                 len(stocks), MIN_DIVIDEND_YIELD_PCT,
-                f"{MIN_MARKET_CAP_USD:,}",
+                _MIN_MARKET_CAP_STR,
             )
 
-            # 1단계: 기본 필터 (배당수익률, 시가총액)
-            filtered = self._apply_filters(stocks)
+            # 1단계: 고수익률 상위 MAX_STOCKS×2 선택
+            # (기본 필터는 _parse_raw_data가 모델 생성 전에 이미 적용했고,
+            # filter_mask는 파싱 경로와 무관하게 불변식을 지키는 가드다.
+            # 바운디드 오버페치: 2배는 HIGH 리스크 탈락분의 여유분이며,
+            # 최종 10개만 쓰일 후보 40+개의 HTTP 조회를 막는다)
+            arrays = DividendScanArrays.from_stocks(stocks)
+            filtered = arrays.top_by_yield(
+                arrays.filter_mask(), MAX_STOCKS * 2,
+            )
 
-            # 2단계: 기술적 지표 조회 + 위험도 평가
+            # 2~3단계: 지표 부착 + 위험도 평가 + HIGH 제외 + 수익성 분석
+            # (융합된 단일 패스)
             logger.info(
-                "기술적 지표 조회 중... (%d개 종목, 예상 %d초)",
-                len(filtered), len(filtered) * 2,
+                "기술적 지표 묶음 조회 중... (%d개 종목)", len(filtered),
             )
-            self._enrich_with_indicators(filtered)
-
-            # 위험도 평가 후 HIGH 리스크 제외
-            before_risk = len(filtered)
-            filtered = [
-                s for s in filtered
-                if s.risk is None or s.risk.risk_level != "HIGH"
-            ]
-            high_risk_excluded = before_risk - len(filtered)
+            kept, high_risk_excluded = self._enrich_and_assess(filtered)
             if high_risk_excluded > 0:
                 logger.info(
                     "HIGH 리스크 제외: %d개 종목", high_risk_excluded,
                 )
 
-            # 3단계: 세후 수익성 분석
-            self._enrich_with_profit_analysis(filtered)
-
             # 4단계: 정렬 (is_profitable True 먼저, 그 다음 net_profit_yield 내림차순)
-            sorted_stocks = self._sort_by_profitability(filtered)
+            sorted_stocks = self._sort_by_profitability(kept)
 
             # 5단계: 최대 개수 제한
             sorted_stocks = sorted_stocks[:MAX_STOCKS]
@@ -228,8 +446,11 @@ class DividendService:
         except (ConnectionError, ValueError, TypeError, OSError) as e:
             logger.error("배당 스캔 실패: %s", e)
             sorted_stocks = []
+            scan_failed = True
+        else:
+            scan_failed = False
 
-        return DividendScanResult(
+        result = DividendScanResult(
             stocks=sorted_stocks,
             scan_range_days=scan_range_days,
             scan_start_date=start_date,
@@ -238,6 +459,14 @@ class DividendService:
             high_risk_excluded=high_risk_excluded,
         )
 
+        # 실패로 비워진 결과는 캐시하지 않는다
+        # (일시 장애가 TTL 동안 빈 다이제스트로 굳는 것을 방지)
+        if not scan_failed:
+            with _SCAN_CACHE_LOCK:
+                _SCAN_CACHE[cache_key] = result
+
+        return result
+
     def assess_risk(self, stock: DividendStock) -> RiskAssessment:
         """기술적 지표 기반으로 배당락일 전후 위험도를 평가한다.
 
@@ -255,8 +484,12 @@ class DividendService:
             RiskAssessment: 위험 등급, 판단 근거, 투자 권고.
         """
         indicators = stock.indicators
-        high_reasons: list[str] = []
-        medium_reasons: list[str] = []
+
+        # 판단 단계에서는 (템플릿, 인자...) 튜플만 모으고,
+        # 등급이 확정된 뒤 채택된 등급의 근거만 실제 문자열로 렌더링한다.
+        # float.__format__ 비용을 탈락 브랜치에는 지불하지 않기 위함이다.
+        high_parts: list[tuple[Any, ...]] = []
+        medium_parts: list[tuple[Any, ...]] = []
 
         if indicators is None:
             return RiskAssessment(
@@ -265,73 +498,80 @@ class DividendService:
                 recommendation="BUY",
             )
 
+        # 지표를 지역 변수로 바인딩 (LOAD_FAST가 모델 속성 접근보다 싸다)
+        rsi = indicators.rsi_14
+        stoch_k = indicators.stochastic_k
+        stoch_d = indicators.stochastic_d
+        volatility = indicators.volatility_20d
+        price_change = indicators.price_change_5d
+
         # RSI 판단
-        if indicators.rsi_14 is not None:
-            if indicators.rsi_14 > _RSI_HIGH_THRESHOLD:
-                high_reasons.append(
-                    f"RSI {indicators.rsi_14:.0f} > {_RSI_HIGH_THRESHOLD} — 심한 과매수"
-                )
-            elif indicators.rsi_14 > _RSI_MEDIUM_THRESHOLD:
-                medium_reasons.append(
-                    f"RSI {indicators.rsi_14:.0f} — 과매수 접근 "
-                    f"({_RSI_MEDIUM_THRESHOLD}~{_RSI_HIGH_THRESHOLD})"
-                )
+        if rsi is not None:
+            if rsi > _RSI_HIGH_THRESHOLD:
+                high_parts.append((
+                    "RSI {:.0f} > {} — 심한 과매수",
+                    rsi, _RSI_HIGH_THRESHOLD,
+                ))
+            elif rsi > _RSI_MEDIUM_THRESHOLD:
+                medium_parts.append((
+                    "RSI {:.0f} — 과매수 접근 ({}~{})",
+                    rsi, _RSI_MEDIUM_THRESHOLD, _RSI_HIGH_THRESHOLD,
+                ))
 
         # Stochastic 판단
-        if indicators.stochastic_k is not None and indicators.stochastic_d is not None:
+        if stoch_k is not None and stoch_d is not None:
             if (
-                indicators.stochastic_k > _STOCH_K_HIGH_THRESHOLD
-                and indicators.stochastic_d > _STOCH_D_HIGH_THRESHOLD
+                stoch_k > _STOCH_K_HIGH_THRESHOLD
+                and stoch_d > _STOCH_D_HIGH_THRESHOLD
             ):
-                high_reasons.append(
-                    f"Stochastic %K={indicators.stochastic_k:.0f}, "
-                    f"%D={indicators.stochastic_d:.0f} — 과매수 구간"
-                )
-            elif indicators.stochastic_k > _STOCH_K_MEDIUM_THRESHOLD:
-                medium_reasons.append(
-                    f"Stochastic %K={indicators.stochastic_k:.0f} > "
-                    f"{_STOCH_K_MEDIUM_THRESHOLD} — 주의"
-                )
+                high_parts.append((
+                    "Stochastic %K={:.0f}, %D={:.0f} — 과매수 구간",
+                    stoch_k, stoch_d,
+                ))
+            elif stoch_k > _STOCH_K_MEDIUM_THRESHOLD:
+                medium_parts.append((
+                    "Stochastic %K={:.0f} > {} — 주의",
+                    stoch_k, _STOCH_K_MEDIUM_THRESHOLD,
+                ))
 
         # 변동성 판단
-        if indicators.volatility_20d is not None:
-            if indicators.volatility_20d > _VOLATILITY_HIGH_THRESHOLD:
-                high_reasons.append(
-                    f"변동성 {indicators.volatility_20d:.1f}% > "
-                    f"{_VOLATILITY_HIGH_THRESHOLD}% — 극단적 변동"
-                )
-            elif indicators.volatility_20d > _VOLATILITY_MEDIUM_THRESHOLD:
-                medium_reasons.append(
-                    f"변동성 {indicators.volatility_20d:.1f}% — 높은 편 "
-                    f"({_VOLATILITY_MEDIUM_THRESHOLD}~{_VOLATILITY_HIGH_THRESHOLD}%)"
-                )
+        if volatility is not None:
+            if volatility > _VOLATILITY_HIGH_THRESHOLD:
+                high_parts.append((
+                    "변동성 {:.1f}% > {}% — 극단적 변동",
+                    volatility, _VOLATILITY_HIGH_THRESHOLD,
+                ))
+            elif volatility > _VOLATILITY_MEDIUM_THRESHOLD:
+                medium_parts.append((
+                    "변동성 {:.1f}% — 높은 편 ({}~{}%)",
+                    volatility,
+                    _VOLATILITY_MEDIUM_THRESHOLD, _VOLATILITY_HIGH_THRESHOLD,
+                ))
 
         # 5일 수익률 판단
-        if indicators.price_change_5d is not None:
-            if indicators.price_change_5d > _PRICE_CHANGE_HIGH_THRESHOLD:
-                high_reasons.append(
-                    f"5일 +{indicators.price_change_5d:.1f}% — "
-                    f"급등 후 되돌림 위험"
-                )
-            elif indicators.price_change_5d > _PRICE_CHANGE_MEDIUM_THRESHOLD:
-                medium_reasons.append(
-                    f"5일 +{indicators.price_change_5d:.1f}% — "
-                    f"상승 과열 주의"
-                )
-
-        # HIGH 리스크: 하나라도 해당 시
-        if high_reasons:
+        if price_change is not None:
+            if price_change > _PRICE_CHANGE_HIGH_THRESHOLD:
+                high_parts.append((
+                    "5일 +{:.1f}% — 급등 후 되돌림 위험", price_change,
+                ))
+            elif price_change > _PRICE_CHANGE_MEDIUM_THRESHOLD:
+                medium_parts.append((
+                    "5일 +{:.1f}% — 상승 과열 주의", price_change,
+                ))
+
+        # HIGH 리스크: 하나라도 해당 시 (HIGH 근거만 렌더링)
+        if high_parts:
             return RiskAssessment(
                 risk_level="HIGH",
-                reasons=high_reasons,
+                reasons=self._render_reasons(high_parts),
                 recommendation="SKIP",
             )
 
-        # MEDIUM 리스크: 하나라도 해당 시
-        if medium_reasons:
+        # MEDIUM 리스크: 하나라도 해당 시 (MEDIUM 근거만 렌더링)
+        if medium_parts:
             return RiskAssessment(
                 risk_level="MEDIUM",
-                reasons=medium_reasons,
+                reasons=self._render_reasons(medium_parts),
                 recommendation="HOLD",
             )
 
@@ -342,6 +582,18 @@ class DividendService:
             recommendation="BUY",
         )
 
+    @staticmethod
+    def _render_reasons(parts: list[tuple[Any, ...]]) -> list[str]:
+        """(템플릿, 인자...) 튜플 목록을 근거 문자열로 렌더링한다.
+
+        Args:
+            parts: (format 템플릿, 포맷 인자...) 튜플 목록.
+
+        Returns:
+            list[str]: 렌더링된 근거 문자열 목록.
+        """
+        return [template.format(*args) for template, *args in parts]
+
     def analyze_profit(self, stock: DividendStock) -> DividendProfitAnalysis:
         """배당 소득세(15.4%)를 감안한 실질 수익성을 분석한다.
 
@@ -401,8 +653,12 @@ class DividendService:
         if not result.stocks:
             return [self._build_empty_notice(result)]
 
-        items = [self._format_stock_line(stock) for stock in result.stocks]
-        bullet_list = "\n".join(f"  {item}" for item in items)
+        # 들여쓰기를 구분자에 포함시켜 포맷과 연결을 join 1회로 처리
+        # (중간 items 리스트 변수 없이 한 패스; join은 리스트 컴프리헨션이
+        # 제너레이터보다 빠르므로 리스트 형태를 유지한다)
+        bullet_list = "  " + "\n  ".join(
+            [self._format_stock_line(stock) for stock in result.stocks]
+        )
 
         title = f"미국 배당락일 임박 ({len(result.stocks)}종목)"
         if result.high_risk_excluded > 0:
@@ -410,7 +666,7 @@ class DividendService:
 
         markdown_text = f":moneybag: *{title}*\n{bullet_list}"
 
-        section = DigestBlock(
+        section = DigestBlock.unchecked(
             type="section",
             text=TextObject(type="mrkdwn", text=markdown_text),
         )
@@ -429,25 +685,33 @@ class DividendService:
 
         Returns:
             list[DividendStock]: 변환된 종목 리스트.
-                파싱 실패한 항목은 건너뛴다.
+                파싱 실패하거나 기본 필터(배당수익률, 시가총액)
+                미달인 항목은 건너뛴다.
         """
         stocks: list[DividendStock] = []
         for item in raw_data:
             try:
-                stock = DividendStock(
-                    ticker=item["ticker"],
-                    company_name=item["company_name"],
-                    ex_dividend_date=date.fromisoformat(
-                        item["ex_dividend_date"]
-                    ),
-                    dividend_yield=item.get("dividend_yield", 0.0),
-                    dividend_amount=item.get("dividend_amount", 0.0),
-                    market_cap=item.get("market_cap", 0),
-                    current_price=item.get("current_price", 0.0),
-                    last_dividend_value=item.get("last_dividend_value", 0.0),
-                    yahoo_finance_url=item["yahoo_finance_url"],
+                # 임계값 미달 행은 모델을 만들기 전에 탈락시킨다.
+                # 탈락 다수(수익률 3% 미만)가 dict 조회 2회 + 비교 2회만
+                # 지불하고, Pydantic 인스턴스 생성 비용을 아예 건너뛴다.
+                if (
+                    item.get("dividend_yield", 0.0) < MIN_DIVIDEND_YIELD_PCT
+                    or item.get("market_cap", 0) < MIN_MARKET_CAP_USD
+                ):
+                    continue
+                # 도구 계층이 이미 정규화한 dict이므로 필드 검증을 생략하는
+                # model_construct로 인스턴스를 만든다 (신뢰 경로 전용).
+                # 외부 입력이 직접 들어오는 경로에는 일반 생성자를 쓸 것.
+                # 단, 기본값 없는 필수 키 누락은 여기서 직접 걸러낸다
+                missing = _REQUIRED_STOCK_KEYS - item.keys()
+                if missing:
+                    raise KeyError(sorted(missing))
+                # 필드별 get() 8회 대신 기본값 dict와 한 번에 머지한다.
+                merged = {**_STOCK_DEFAULTS, **item}
+                merged["ex_dividend_date"] = date.fromisoformat(
+                    merged["ex_dividend_date"]
                 )
-                stocks.append(stock)
+                stocks.append(DividendStock.model_construct(**merged))
             except (KeyError, ValueError, TypeError) as e:
                 logger.warning("종목 데이터 파싱 실패: %s", e)
         return stocks
@@ -463,47 +727,114 @@ class DividendService:
         Returns:
             list[DividendStock]: 필터 조건을 충족하는 종목만 포함.
         """
-        return [
-            s for s in stocks
-            if s.dividend_yield >= MIN_DIVIDEND_YIELD_PCT
-            and s.market_cap >= MIN_MARKET_CAP_USD
-        ]
+        if not stocks:
+            return []
 
-    def _enrich_with_indicators(
+        # SoA 컬럼으로 변환 후 벡터 비교 한 번으로 마스크 계산
+        # (종목별 Pydantic 속성 접근 루프 대체)
+        arrays = DividendScanArrays.from_stocks(stocks)
+        return arrays.to_stocks(arrays.filter_mask())
+
+    def _enrich_and_assess(
         self, stocks: list[DividendStock]
-    ) -> None:
-        """종목 리스트에 기술적 지표와 위험도 평가를 추가한다.
+    ) -> tuple[list[DividendStock], int]:
+        """지표 부착, 위험도 평가, HIGH 제외, 수익성 분석을 한 패스로 수행한다.
 
-        개별 종목의 지표 조회 실패 시 해당 종목만 스킵하고
-        전체 프로세스는 계속된다.
+        지표 조회는 종목별 단건 요청 대신 묶음 요청 1~2회로 수행하여
+        HTTP 왕복 횟수를 최소화한다.
+        묶음 응답에 없는 종목(데이터 부족/조회 실패)은 지표 없이
+        위험도 평가만 수행하고 전체 프로세스는 계속된다.
+        HIGH 분류는 코호트 전체를 벡터 연산 한 패스로 판정하고,
+        생존 종목만 근거 문자열을 포함한 개별 평가와
+        수익성 분석을 수행한다 (중간 리스트 재생성 없음).
 
         Args:
             stocks: 지표를 추가할 종목 리스트 (in-place 수정).
+
+        Returns:
+            tuple[list[DividendStock], int]:
+                (HIGH 리스크를 제외한 종목 리스트, 제외된 종목 수).
         """
-        for stock in stocks:
-            try:
-                raw_indicators = get_technical_indicators(stock.ticker)
-                if raw_indicators is not None:
-                    stock.indicators = TechnicalIndicators(**raw_indicators)
-            except (ConnectionError, ValueError, TypeError, OSError) as e:
-                logger.warning(
-                    "종목 %s 기술적 지표 조회 실패 (스킵): %s",
-                    stock.ticker, e,
-                )
+        if not stocks:
+            return [], 0
 
-            # 지표 유무와 관계없이 위험도 평가 수행
+        try:
+            batch = _retry_io(
+                get_technical_indicators_batch,
+                [s.ticker for s in stocks],
+            )
+        except (ConnectionError, ValueError, TypeError, OSError) as e:
+            logger.warning("기술적 지표 묶음 조회 실패: %s", e)
+            batch = {}
+
+        for stock in stocks:
+            raw_indicators = batch.get(stock.ticker)
+            if raw_indicators is not None:
+                stock.indicators = TechnicalIndicators(**raw_indicators)
+
+        # 전체 코호트의 위험 등급을 배열 연산 한 패스로 분류한다.
+        # HIGH로 탈락할 종목은 근거 문자열 렌더링을 포함한
+        # 개별 assess_risk 비용 자체를 지불하지 않는다.
+        high_mask = self._high_risk_mask(stocks)
+
+        kept: list[DividendStock] = []
+        excluded = 0
+        for stock, is_high in zip(stocks, high_mask):
+            if is_high:
+                excluded += 1
+                continue
+
+            # 생존 종목(≤ MAX_STOCKS×2)만 근거 포함 평가 + 수익성 분석
             stock.risk = self.assess_risk(stock)
+            stock.profit_analysis = self.analyze_profit(stock)
+            kept.append(stock)
 
-    def _enrich_with_profit_analysis(
-        self, stocks: list[DividendStock]
-    ) -> None:
-        """종목 리스트에 세후 수익성 분석을 추가한다.
+        return kept, excluded
+
+    @staticmethod
+    def _high_risk_mask(stocks: list[DividendStock]) -> np.ndarray:
+        """코호트 전체의 HIGH 리스크 여부를 벡터 연산으로 분류한다.
+
+        지표 5종을 float64 SoA 컬럼으로 뽑아 임계값 비교를
+        배열 단위로 수행한다. 지표가 없는 값은 NaN으로 채우며,
+        NaN 비교는 False이므로 "지표 없음 → 해당 조건 미적용"이라는
+        assess_risk의 스칼라 의미론과 일치한다.
 
         Args:
-            stocks: 분석을 추가할 종목 리스트 (in-place 수정).
+            stocks: 분류할 종목 리스트 (indicators 부착 완료 상태).
+
+        Returns:
+            np.ndarray: stocks와 같은 길이의 HIGH 여부 불리언 배열.
         """
-        for stock in stocks:
-            stock.profit_analysis = self.analyze_profit(stock)
+        count = len(stocks)
+
+        def _column(attr: str) -> np.ndarray:
+            return np.fromiter(
+                (
+                    value
+                    if s.indicators is not None
+                    and (value := getattr(s.indicators, attr)) is not None
+                    else np.nan
+                    for s in stocks
+                ),
+                dtype=np.float64, count=count,
+            )
+
+        rsi = _column("rsi_14")
+        stoch_k = _column("stochastic_k")
+        stoch_d = _column("stochastic_d")
+        volatility = _column("volatility_20d")
+        price_change = _column("price_change_5d")
+
+        return (
+            (rsi > _RSI_HIGH_THRESHOLD)
+            | (
+                (stoch_k > _STOCH_K_HIGH_THRESHOLD)
+                & (stoch_d > _STOCH_D_HIGH_THRESHOLD)
+            )
+            | (volatility > _VOLATILITY_HIGH_THRESHOLD)
+            | (price_change > _PRICE_CHANGE_HIGH_THRESHOLD)
+        )
 
     def _estimate_ex_date_drop(self, stock: DividendStock) -> float:
         """배당락일 예상 주가 하락률을 추정한다.
@@ -525,35 +856,31 @@ class DividendService:
             예상 주가 하락률 (%).
         """
         # 1회 배당금 결정: last_dividend_value가 있으면 사용,
-        # 없으면 dividend_amount(연간)를 4로 나누어 분기 근사
+        # 없으면 dividend_amount(연간) × 0.25로 분기 근사
+        # (왜 0.25인가: 미국 주식의 ~80%가 분기 배당이므로 연간/4가
+        # 합리적 근사치이며, 곱셈이 나눗셈보다 싸다)
+        price = stock.current_price
         per_payment = stock.last_dividend_value
-        if per_payment <= 0:
-            # 왜 4인가: 미국 주식의 ~80%가 분기 배당이므로
-            # 연간 배당금 / 4가 합리적인 근사치
-            per_payment = stock.dividend_amount / 4
+        if per_payment <= 0.0:
+            per_payment = stock.dividend_amount * 0.25
 
-        if stock.current_price <= 0 or per_payment <= 0:
+        # 퇴화 입력 가드를 한 번에 처리하여 정상 경로를 직선화한다
+        if price <= 0.0 or per_payment <= 0.0:
             # 현재가 또는 배당금 정보 없으면 세전 배당수익률/4을 낙폭으로 근사
-            return stock.dividend_yield / 4
-
-        # 기본 낙폭 = 1회 배당금 / 현재가 × 100
-        base_drop = (per_payment / stock.current_price) * 100
+            return stock.dividend_yield * 0.25
 
         # 변동성 보정: 변동성이 높을수록 낙폭이 클 가능성
+        # (변동성 %를 0~0.5 범위의 보정 팩터로 변환)
         volatility_factor = 0.0
-        if (
-            stock.indicators is not None
-            and stock.indicators.volatility_20d is not None
-        ):
-            # 변동성(%)를 0~0.5 범위의 보정 팩터로 변환
+        indicators = stock.indicators
+        if indicators is not None and indicators.volatility_20d is not None:
             volatility_factor = min(
-                stock.indicators.volatility_20d / 100,
+                indicators.volatility_20d * 0.01,
                 _VOLATILITY_FACTOR_CAP,
             )
 
-        # 보정된 낙폭 = 기본 낙폭 × (1 + 변동성 팩터)
-        adjusted_drop = base_drop * (1 + volatility_factor)
-        return adjusted_drop
+        # 낙폭 = (1회 배당금 / 현재가 × 100) × (1 + 변동성 팩터)
+        return (per_payment / price) * 100.0 * (1.0 + volatility_factor)
 
     def _build_profit_verdict(
         self,
@@ -593,25 +920,32 @@ class DividendService:
 
         정렬 우선순위:
         1. is_profitable = True 먼저
-        2. net_profit_yield 내림차순
+        2. net_profit_yield 내림차순 (분석 없으면 배당수익률로 대체)
+
+        튜플 키 1회 정렬 대신 스칼라 키 2회의 안정 정렬을 사용한다.
+        키 함수가 튜플을 할당하지 않아 비교당 비용이 싸고,
+        2차 정렬의 안정성이 1차 정렬 순서를 그룹 내에서 보존한다.
 
         Args:
-            stocks: 정렬 전 종목 리스트.
+            stocks: 정렬할 종목 리스트 (in-place 정렬).
 
         Returns:
-            list[DividendStock]: 정렬된 종목 리스트.
+            list[DividendStock]: 정렬된 종목 리스트 (입력과 동일 객체).
         """
-        def _sort_key(s: DividendStock) -> tuple[int, float]:
-            if s.profit_analysis is not None:
-                # is_profitable True(1) → 0 (먼저), False(0) → 1 (나중)
-                profitable_order = 0 if s.profit_analysis.is_profitable else 1
-                # net_profit_yield 내림차순 → 부호 반전
-                profit = -s.profit_analysis.net_profit_yield
-                return (profitable_order, profit)
-            # 분석 없으면 수익률로 대체
-            return (1, -s.dividend_yield)
-
-        return sorted(stocks, key=_sort_key)
+        # 1차: 수익성 지표 내림차순 (분석 없으면 배당수익률 대체)
+        stocks.sort(
+            key=lambda s: s.profit_analysis.net_profit_yield
+            if s.profit_analysis is not None
+            else s.dividend_yield,
+            reverse=True,
+        )
+        # 2차: is_profitable True(False 키) 먼저 — 안정 정렬이므로
+        # 같은 그룹 안에서는 1차 정렬 순서가 유지된다
+        stocks.sort(
+            key=lambda s: s.profit_analysis is None
+            or not s.profit_analysis.is_profitable,
+        )
+        return stocks
 
     def _format_stock_line(self, stock: DividendStock) -> str:
         """단일 종목을 Slack 메시지용 문자열로 포맷팅한다.
@@ -628,30 +962,33 @@ class DividendService:
         # 리스크 레벨 이모지
         risk_emoji = self._get_risk_emoji(stock)
 
-        url = _YAHOO_URL_TEMPLATE.format(ticker=stock.ticker)
+        # f-string은 .format의 템플릿 재파싱 없이 바이트코드로 조립된다
+        ticker = stock.ticker
+        url = f"<https://finance.yahoo.com/quote/{ticker}|{ticker}>"
 
-        # 기본 정보
-        line = f"{risk_emoji} {url} — 배당 {stock.dividend_yield:.1f}%"
+        # += 연결은 조각마다 새 문자열을 복사하므로
+        # 조각 리스트에 모아 마지막에 join 1회로 합친다
+        parts: list[str] = [
+            f"{risk_emoji} {url} — 배당 {stock.dividend_yield:.1f}%"
+        ]
 
         # 기술적 지표 간략 표시
-        if stock.indicators is not None:
-            parts: list[str] = []
-            if stock.indicators.rsi_14 is not None:
-                parts.append(f"RSI {stock.indicators.rsi_14:.0f}")
-            if stock.indicators.volatility_20d is not None:
-                parts.append(f"변동성 {stock.indicators.volatility_20d:.0f}%")
-            if parts:
-                line += f" | {' | '.join(parts)}"
+        indicators = stock.indicators
+        if indicators is not None:
+            if indicators.rsi_14 is not None:
+                parts.append(f"RSI {indicators.rsi_14:.0f}")
+            if indicators.volatility_20d is not None:
+                parts.append(f"변동성 {indicators.volatility_20d:.0f}%")
 
         # 세후 수익성 한줄
         if stock.profit_analysis is not None:
             pa = stock.profit_analysis
             if pa.is_profitable:
-                line += f" | 순이익 +{pa.net_profit_yield:.2f}%"
+                parts.append(f"순이익 +{pa.net_profit_yield:.2f}%")
             else:
-                line += f" | :warning: {pa.net_profit_yield:+.2f}%"
+                parts.append(f":warning: {pa.net_profit_yield:+.2f}%")
 
-        return line
+        return " | ".join(parts)
 
     def _get_risk_emoji(self, stock: DividendStock) -> str:
         """종목의 리스크 레벨에 맞는 이모지를 반환한다.
@@ -664,12 +1001,7 @@ class DividendService:
         """
         if stock.risk is None:
             return ":white_circle:"
-        emoji_map = {
-            "LOW": ":large_green_circle:",
-            "MEDIUM": ":large_yellow_circle:",
-            "HIGH": ":red_circle:",
-        }
-        return emoji_map.get(stock.risk.risk_level, ":white_circle:")
+        return _RISK_EMOJI.get(stock.risk.risk_level, ":white_circle:")
 
     def _build_empty_notice(
         self, result: DividendScanResult
@@ -689,7 +1021,7 @@ class DividendService:
             excluded_msg = (
                 f"\n  (HIGH 리스크 {result.high_risk_excluded}종목 제외됨)"
             )
-        return DigestBlock(
+        return DigestBlock.unchecked(
             type="section",
             text=TextObject(
                 type="mrkdwn",
@@ -717,7 +1049,7 @@ if __name__ == "__main__":
     for weekday in range(7):
         test_date = date(2026, 2, 16 + weekday)
         result_range = service.calculate_scan_range(test_date)
-        day_name = calendar.day_name[test_date.weekday()]
+        day_name = _DAY_NAMES[test_date.weekday()]
         print(f"  {day_name:9s} ({test_date}): {result_range}")
 
     # 기본 동적 범위 스캔 (기술적 지표 + 수익성 분석 포함)
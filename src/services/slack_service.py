@@ -5,6 +5,7 @@ Slack 관련 비즈니스 로직을 전담한다.
 Bolt 핸들러와 crewAI Agent 모두 이 서비스를 통해 다이제스트를 실행한다.
 """
 
+import asyncio
 import logging
 import time
 from datetime import datetime
@@ -30,6 +31,11 @@ logger = logging.getLogger(__name__)
 # 인터랙티브 버튼의 action_id 상수
 RERUN_ACTION_ID = "rerun_digest_action"
 
+# divider 블록 싱글턴
+# 값이 불변인 블록이므로 실행마다 5개씩 새로 만들지 않고 재사용한다
+# (아무 곳에서도 블록을 in-place 수정하지 않으므로 공유해도 안전)
+_DIVIDER_BLOCK = DigestBlock.unchecked(type="divider")
+
 
 def format_section(
     title: str, items: list[str], emoji: str
@@ -59,7 +65,7 @@ def format_section(
     bullet_list = "\n".join(f"  • {item}" for item in items)
     markdown_text = f"{emoji} *{title}*\n{bullet_list}"
 
-    return DigestBlock(
+    return DigestBlock.unchecked(
         type="section",
         text=TextObject(type="mrkdwn", text=markdown_text),
     )
@@ -108,12 +114,15 @@ class SlackService:
                 소요 시간, 종목 수).
                 실패 시에도 예외 대신 success=False인 결과를 반환한다.
         """
-        start_time = time.time()
+        # 왜 perf_counter_ns인가: time.time()은 NTP 보정으로 뒤로 갈 수 있어
+        # 경과 시간이 음수가 될 수 있다. 단조 증가 정수 카운터로 측정하고
+        # 초 단위 변환은 마지막에 한 번만 수행한다.
+        start_ns = time.perf_counter_ns()
 
         try:
             blocks, stock_count = self._build_digest_blocks()
             send_digest(blocks, self._config)
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
 
             result = DigestResult(
                 success=True,
@@ -122,7 +131,7 @@ class SlackService:
                 stock_count=stock_count,
             )
         except (ValueError, RuntimeError, ConnectionError, OSError) as e:
-            elapsed = time.time() - start_time
+            elapsed = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error("다이제스트 발송 실패: %s", e)
 
             result = DigestResult(
@@ -180,31 +189,60 @@ class SlackService:
         """
         today = datetime.now().strftime("%Y-%m-%d")
 
-        # 배당 스캔 1회 실행, 결과를 배당 섹션 + 토론 섹션에서 공유
-        scan_result = self._scan_dividends_once()
+        # 서로 독립적인 데이터 수집(배당/실적/금리)은 동시에 실행한다.
+        # 모두 외부 API I/O 바운드이므로 전체 소요 시간이
+        # 합(sum)이 아닌 최대(max) 수준으로 줄어든다.
+        scan_result, earnings_blocks, rate_blocks = asyncio.run(
+            self._collect_sections()
+        )
+
+        # 배당 스캔 결과를 배당 섹션 + 토론 섹션에서 공유
         dividend_blocks, stock_count = (
             self._build_dividend_section_from_result(scan_result)
         )
-        earnings_blocks = self._build_earnings_section()
-        rate_blocks = self._build_rate_section()
+        # 토론은 배당 스캔 결과에 의존하므로 수집 완료 후 실행
         debate_blocks = self._build_debate_section(scan_result)
 
         blocks = [
             self._build_header_block(today),
-            DigestBlock(type="divider"),
+            _DIVIDER_BLOCK,
             *dividend_blocks,
-            DigestBlock(type="divider"),
+            _DIVIDER_BLOCK,
             *earnings_blocks,
-            DigestBlock(type="divider"),
+            _DIVIDER_BLOCK,
             *rate_blocks,
-            DigestBlock(type="divider"),
+            _DIVIDER_BLOCK,
             *debate_blocks,
-            DigestBlock(type="divider"),
+            _DIVIDER_BLOCK,
             self._build_rerun_action_block(),
         ]
 
         return blocks, stock_count
 
+    async def _collect_sections(
+        self,
+    ) -> tuple[
+        DividendScanResult | None,
+        list[DigestBlock],
+        list[DigestBlock],
+    ]:
+        """독립적인 섹션 데이터를 동시에 수집한다.
+
+        배당 스캔, 실적발표 스캔, 금리 조회는 서로 의존성이 없는
+        I/O 바운드 작업이므로 asyncio.to_thread로 스레드에 분산하고
+        asyncio.gather로 동시에 대기한다.
+        각 작업은 내부에서 예외를 처리하므로 gather가 중단되지 않는다.
+
+        Returns:
+            tuple: (배당 스캔 결과, 실적발표 블록 목록, 금리 블록 목록).
+        """
+        scan_result, earnings_blocks, rate_blocks = await asyncio.gather(
+            asyncio.to_thread(self._scan_dividends_once),
+            asyncio.to_thread(self._build_earnings_section),
+            asyncio.to_thread(self._build_rate_section),
+        )
+        return scan_result, earnings_blocks, rate_blocks
+
     def _scan_dividends_once(self) -> DividendScanResult | None:
         """배당 스캔을 1회 실행하고 결과를 반환한다.
 
@@ -228,7 +266,7 @@ class SlackService:
         Returns:
             header 타입의 DigestBlock.
         """
-        return DigestBlock(
+        return DigestBlock.unchecked(
             type="header",
             text=TextObject(
                 type="plain_text",
@@ -250,7 +288,7 @@ class SlackService:
         """
         if scan_result is None:
             return [
-                DigestBlock(
+                DigestBlock.unchecked(
                     type="section",
                     text=TextObject(
                         type="mrkdwn",
@@ -265,7 +303,7 @@ class SlackService:
         except (ValueError, TypeError) as e:
             logger.error("배당 섹션 포맷팅 실패 (격리 처리): %s", e)
             return [
-                DigestBlock(
+                DigestBlock.unchecked(
                     type="section",
                     text=TextObject(
                         type="mrkdwn",
@@ -290,7 +328,7 @@ class SlackService:
         except (ConnectionError, ValueError, TypeError, OSError) as e:
             logger.error("실적발표 섹션 생성 실패 (격리 처리): %s", e)
             return [
-                DigestBlock(
+                DigestBlock.unchecked(
                     type="section",
                     text=TextObject(
                         type="mrkdwn",
@@ -315,7 +353,7 @@ class SlackService:
         except (ValueError, ConnectionError, TypeError, OSError) as e:
             logger.error("금리 섹션 생성 실패 (격리 처리): %s", e)
             return [
-                DigestBlock(
+                DigestBlock.unchecked(
                     type="section",
                     text=TextObject(
                         type="mrkdwn",
@@ -359,7 +397,7 @@ class SlackService:
         Returns:
             actions 타입의 DigestBlock.
         """
-        return DigestBlock(
+        return DigestBlock.unchecked(
             type="actions",
             elements=[
                 ButtonElement(
@@ -6,6 +6,8 @@ SlackService에 위임한다.
 """
 
 import logging
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from slack_bolt import App
@@ -16,6 +18,13 @@ from src.services.slack_service import RERUN_ACTION_ID, SlackService
 
 logger = logging.getLogger(__name__)
 
+# 다이제스트 실행용 워커 풀
+# 왜 분리하나: run_digest()는 수십 초가 걸릴 수 있는데, Socket Mode의
+# 디스패치 스레드에서 그대로 실행하면 그동안 후속 이벤트 처리가 막히고
+# Slack이 재전송한 이벤트로 중복 실행이 발생한다. ack() 직후
+# 무거운 작업은 워커 풀로 넘겨 디스패치 스레드를 즉시 돌려준다.
+_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
 
 def create_bolt_app(config: SlackConfig) -> App:
     """Slack Bolt App 인스턴스를 생성하고 핸들러를 등록한다.
@@ -66,10 +75,9 @@ def _register_digest_command(app: App, service: SlackService) -> None:
         ack()
         subcommand = command.get("text", "").strip().lower()
 
-        if subcommand == "now":
-            _handle_digest_now(service, respond)
-        elif subcommand == "status":
-            _handle_digest_status(service, respond)
+        handler = _SUBCOMMAND_HANDLERS.get(subcommand)
+        if handler is not None:
+            handler(service, respond)
         else:
             respond("사용법: `/digest now` | `/digest status`")
 
@@ -129,6 +137,47 @@ def _handle_digest_status(service: SlackService, respond: Any) -> None:
         respond(f":warning: 오류 발생: {e}")
 
 
+def _submit_digest_now(service: SlackService, respond: Any) -> None:
+    """'now' 서브커맨드: 다이제스트 실행을 워커 풀에 넘긴다.
+
+    Args:
+        service: 비즈니스 로직을 위임할 SlackService.
+        respond: 사용자에게 응답을 보내는 콜백.
+    """
+    # 무거운 실행은 워커 풀로 — 디스패치 스레드를 막지 않는다
+    _EXECUTOR.submit(_handle_digest_now, service, respond)
+
+
+# 서브커맨드 → 핸들러 디스패치 테이블
+# 왜 dict인가: if/elif 사슬은 서브커맨드가 늘수록 분기가 자라지만
+# dict 조회는 항목 1줄 추가로 끝나고, 어떤 커맨드가 지원되는지도
+# 한 곳에 모여 드러난다
+_SUBCOMMAND_HANDLERS: dict[str, Callable[[SlackService, Any], None]] = {
+    "now": _submit_digest_now,
+    "status": _handle_digest_status,
+}
+
+
+def _handle_rerun(service: SlackService, respond: Any) -> None:
+    """'다시 실행' 버튼의 다이제스트 재실행을 처리한다.
+
+    워커 풀 스레드에서 실행되므로 모든 예외를 내부에서 catch하여
+    respond()로 사용자에게 전달한다 (스레드에서 삼켜지지 않도록).
+
+    Args:
+        service: 비즈니스 로직을 위임할 SlackService.
+        respond: 사용자에게 응답을 보내는 콜백.
+    """
+    respond(":hourglass_flowing_sand: 다시 실행 중...")
+
+    try:
+        result = service.run_digest()
+        _respond_with_result(result, respond)
+    except Exception as e:
+        logger.error("다시 실행 중 오류: %s", e)
+        respond(f":warning: 오류 발생: {e}")
+
+
 def _register_rerun_action(app: App, service: SlackService) -> None:
     """'다시 실행' 버튼 액션 핸들러를 등록한다.
 
@@ -150,14 +199,8 @@ def _register_rerun_action(app: App, service: SlackService) -> None:
         """
         # Slack은 3초 이내 ack()를 요구하므로 즉시 호출
         ack()
-        respond(":hourglass_flowing_sand: 다시 실행 중...")
-
-        try:
-            result = service.run_digest()
-            _respond_with_result(result, respond)
-        except Exception as e:
-            logger.error("다시 실행 중 오류: %s", e)
-            respond(f":warning: 오류 발생: {e}")
+        # 무거운 실행은 워커 풀로 — 디스패치 스레드를 막지 않는다
+        _EXECUTOR.submit(_handle_rerun, service, respond)
 
 
 def start_socket_mode(config: SlackConfig) -> None:
@@ -178,6 +221,42 @@ def start_socket_mode(config: SlackConfig) -> None:
     handler.start()
 
 
+def start_http_mode(config: SlackConfig, port: int = 3000) -> None:
+    """HTTP 이벤트 수신 모드로 Bolt App을 시작한다.
+
+    Socket Mode는 WebSocket 계층의 스케줄링 때문에 이벤트 전달이
+    수 초씩 늘어지는 꼬리 지연이 보고되어 있다. HTTPS 엔드포인트
+    (/slack/events)를 노출할 수 있는 배포 환경에서는 HTTP 수신이
+    ack 지연을 안정적으로 3초 아래로 유지한다.
+    엔드포인트를 노출할 수 없는 환경(로컬, 사내망)에서는
+    start_socket_mode를 그대로 사용한다.
+
+    이 함수는 블로킹 호출이며, 프로세스 종료까지 실행된다.
+
+    Args:
+        config: Slack 연동 설정값 (bot_token 포함).
+        port: HTTP 서버 리스닝 포트.
+    """
+    # FastAPI/uvicorn은 이 모드에서만 필요하므로 함수 안에서 임포트한다
+    # (Socket Mode 콜드 스타트에 웹 서버 임포트 비용을 지우지 않는다)
+    import uvicorn
+    from fastapi import FastAPI, Request
+    from slack_bolt.adapter.fastapi import SlackRequestHandler
+
+    app = create_bolt_app(config)
+    handler = SlackRequestHandler(app)
+
+    api = FastAPI()
+
+    @api.post("/slack/events")
+    async def slack_events(request: Request) -> Any:
+        """Slack 이벤트/커맨드/인터랙션 요청을 Bolt로 위임한다."""
+        return await handler.handle(request)
+
+    logger.info("Slack Bolt App HTTP 모드 시작 (port=%d)", port)
+    uvicorn.run(api, host="0.0.0.0", port=port)
+
+
 if __name__ == "__main__":
     """Socket Mode로 Bolt App을 실행한다."""
     from dotenv import load_dotenv
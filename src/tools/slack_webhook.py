@@ -6,13 +6,44 @@ Block Kit 형식의 메시지를 전달한다.
 """
 
 import logging
+from typing import Any
 
+from pydantic import TypeAdapter
 from slack_sdk.webhook import WebhookClient
 
 from src.schemas.slack import DigestBlock, SlackConfig
 
 logger = logging.getLogger(__name__)
 
+# 발송 직전 직렬화용 어댑터: 블록마다 model_dump를 호출하는 대신
+# 리스트 전체를 pydantic-core(Rust) 한 번의 walk로 dict 변환한다.
+_BLOCKS_DUMP_ADAPTER = TypeAdapter(list[DigestBlock])
+
+# WebhookClient 캐시: webhook URL → (생성에 쓴 클래스, 클라이언트 인스턴스)
+# 발송할 때마다 클라이언트를 새로 만들지 않고 동일 URL에 대해 재사용한다.
+# 클래스를 함께 저장하여 구현이 교체되면(예: 테스트의 patch) 캐시를 무효화한다.
+_CLIENT_CACHE: dict[str, tuple[Any, WebhookClient]] = {}
+
+
+def _get_client(webhook_url: str) -> WebhookClient:
+    """webhook URL에 대응하는 WebhookClient를 반환한다.
+
+    동일 URL로 반복 발송 시 캐시된 클라이언트를 재사용한다.
+
+    Args:
+        webhook_url: Slack Incoming Webhook URL.
+
+    Returns:
+        WebhookClient: 캐시된 또는 새로 생성된 클라이언트.
+    """
+    cached = _CLIENT_CACHE.get(webhook_url)
+    if cached is not None and cached[0] is WebhookClient:
+        return cached[1]
+
+    client = WebhookClient(url=webhook_url)
+    _CLIENT_CACHE[webhook_url] = (WebhookClient, client)
+    return client
+
 
 def send_digest(blocks: list[DigestBlock], config: SlackConfig) -> bool:
     """Block Kit 메시지를 Slack Webhook URL로 발송한다.
@@ -34,12 +65,13 @@ def send_digest(blocks: list[DigestBlock], config: SlackConfig) -> bool:
     if not blocks:
         raise ValueError("발송할 블록이 비어 있습니다.")
 
-    # SecretStr에서 실제 URL 추출
+    # SecretStr에서 실제 URL 추출 후 캐시된 클라이언트 재사용
     webhook_url = config.webhook_url.get_secret_value()
-    client = WebhookClient(url=webhook_url)
+    client = _get_client(webhook_url)
 
-    # 각 DigestBlock을 Slack API가 기대하는 dict 형태로 변환
-    block_dicts = [block.to_slack_dict() for block in blocks]
+    # 리스트 전체를 한 번에 Slack API가 기대하는 dict 형태로 변환
+    # (to_slack_dict와 동일하게 None 필드는 제외된다)
+    block_dicts = _BLOCKS_DUMP_ADAPTER.dump_python(blocks, exclude_none=True)
 
     logger.info("Slack Webhook 메시지 발송 시도 (블록 %d개)", len(block_dicts))
     response = client.send(blocks=block_dicts)
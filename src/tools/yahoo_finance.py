@@ -7,20 +7,110 @@ yfinance 라이브러리를 사용하여 미국 주식의 배당락일, 배당
 비즈니스 로직(필터링, 정렬, 판단) 없이 순수 API 호출 + 계산만 담당한다.
 """
 
+import functools
 import logging
 import math
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime, timedelta, timezone
 from typing import Any
 
+import numpy as np
 import yfinance as yf
+from cachetools import TTLCache
+from numpy.lib.stride_tricks import sliding_window_view
+from cachetools.keys import hashkey
+from curl_cffi import requests as curl_requests
 
 logger = logging.getLogger(__name__)
 
+# yf.Ticker 공유 세션: 세션을 넘기지 않으면 yfinance가 Ticker마다
+# 새 TLS 세션을 만들고 쿠키/crumb 핸드셰이크를 반복한다.
+# 모듈 전체가 세션 1개를 공유하면 커넥션 풀 재사용으로
+# 종목당 핸드셰이크 비용이 1회로 상각된다.
+_YF_SESSION: curl_requests.Session | None = None
+
+
+def _get_yf_session() -> curl_requests.Session:
+    """yfinance 호출에 공유할 HTTP 세션을 반환한다 (lazy 생성).
+
+    Returns:
+        curl_requests.Session: 모듈 수준에서 재사용되는 세션.
+    """
+    global _YF_SESSION
+    if _YF_SESSION is None:
+        # yfinance 기본값과 동일한 브라우저 의장(impersonate) 설정
+        _YF_SESSION = curl_requests.Session(impersonate="chrome")
+    return _YF_SESSION
+
+
+class _TokenBucket:
+    """Yahoo 아웃바운드 호출용 토큰 버킷 레이트리미터.
+
+    Yahoo는 짧은 시간에 요청이 몰리면(경험상 ~110건 수준) 429 없이
+    빈 응답을 돌려주기 시작해 스캔이 조용히 비어 버린다.
+    모든 네트워크 호출이 나가기 전에 토큰 1개를 확보하게 하여
+    스레드 풀 병렬성은 유지하면서 순간 요청량만 한도 아래로 누른다.
+
+    time.monotonic 기반이라 시스템 시계 조정에 영향받지 않으며,
+    Lock으로 보호되어 워커 스레드 간에 안전하게 공유된다.
+    """
+
+    def __init__(self, capacity: float, refill_per_sec: float) -> None:
+        """버킷을 가득 찬 상태로 초기화한다.
+
+        Args:
+            capacity: 버스트로 허용할 최대 토큰 수.
+            refill_per_sec: 초당 토큰 보충 속도 (= 지속 요청 한도).
+        """
+        self._capacity = capacity
+        self._refill_per_sec = refill_per_sec
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 확보할 때까지 블로킹한다.
+
+        토큰이 부족하면 다음 토큰이 채워질 시점까지만 sleep하고
+        재시도하므로 불필요한 busy-wait가 없다.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                # 마지막 확인 이후 경과 시간만큼 토큰을 보충한다
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens
+                    + (now - self._last_refill) * self._refill_per_sec,
+                )
+                self._last_refill = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait_sec = (1.0 - self._tokens) / self._refill_per_sec
+            time.sleep(wait_sec)
+
+    def reset(self) -> None:
+        """버킷을 가득 찬 상태로 되돌린다 (테스트 격리용)."""
+        with self._lock:
+            self._tokens = self._capacity
+            self._last_refill = time.monotonic()
+
+
+# 왜 100/10인가: 배당 스캔(54건) + 지표 묶음(수 건)이 버스트로 한 번에
+# 나가도 한도 안이고, 지속 10 req/s면 Yahoo가 빈 응답을 주기 시작하는
+# 관측 임계치(~110건 버스트)에 도달하지 않는다.
+_YF_RATE_LIMITER = _TokenBucket(capacity=100, refill_per_sec=10.0)
+
 # 미국 주요 배당주 티커 목록
 # 배당 귀족(Dividend Aristocrats) + 고배당 대형주를 포함한다.
 # 왜 이 목록인가: S&P 500 구성종목 중 배당수익률이 높고
 # 배당 이력이 안정적인 대형주를 선별하여 스캔 효율을 높인다.
-DIVIDEND_TICKERS: list[str] = [
+# 런타임에 변경되지 않는 고정 목록이므로 튜플로 고정한다
+# (리스트의 성장 여유 할당이 없고, 실수로 인한 변형도 차단)
+DIVIDEND_TICKERS: tuple[str, ...] = (
     # 헬스케어
     "JNJ", "PFE", "ABBV", "MRK", "BMY", "AMGN", "GILD",
     # 소비재
@@ -39,15 +129,49 @@ DIVIDEND_TICKERS: list[str] = [
     "O", "SCHD", "VYM",
     # 기타 고배당
     "DOW", "LYB", "KHC", "F",
-]
+)
 
 # Yahoo Finance 종목 페이지 URL 템플릿
 _YAHOO_FINANCE_URL_TEMPLATE = "https://finance.yahoo.com/quote/{ticker}"
 
 
+def _yahoo_finance_url(ticker: str) -> str:
+    """종목의 Yahoo Finance 페이지 URL을 반환한다.
+
+    고정 유니버스의 URL은 모듈 로드 시 미리 만들어 둔 dict에서 찾고,
+    목록 밖 티커만 format으로 생성한다.
+
+    Args:
+        ticker: 종목 심볼.
+
+    Returns:
+        str: Yahoo Finance 종목 페이지 URL.
+    """
+    url = _YAHOO_FINANCE_URLS.get(ticker)
+    if url is None:
+        url = _YAHOO_FINANCE_URL_TEMPLATE.format(ticker=ticker)
+    return url
+
+
 # 날짜 범위 미지정 시 기본 스캔 일수
 _DEFAULT_DAYS_AHEAD = 3
 
+# 배당 스캔 결과 TTL 캐시 (키: 스캔 날짜 범위)
+# 왜 1시간인가: 배당락일 자체는 분기에 한 번 바뀌는 수준이지만
+# current_price는 장중에 움직이므로, Slack "다시 실행" 버튼의
+# 반복 실행은 흡수하되 수익성 분석이 심하게 낡지 않는 선으로 잡았다.
+_DIVIDENDS_CACHE: TTLCache = TTLCache(maxsize=32, ttl=3600)
+
+# cachetools 캐시는 스레드 안전하지 않다 (조회도 만료 리스트를 변형한다).
+# 단일 비행 가드는 같은 키의 중복 조회만 막을 뿐, 대기자들의 get과
+# 담당 스레드의 삽입은 여전히 겹칠 수 있으므로 접근을 락으로 감싼다.
+_DIVIDENDS_CACHE_LOCK = threading.Lock()
+
+# 종목 정보 병렬 조회 스레드 수
+# 왜 8인가: 조회는 네트워크 대기가 지배적이라 GIL 경합이 없고,
+# 이 이상 늘리면 Yahoo 레이트리밋(429)에 걸릴 확률만 높아진다.
+_FETCH_MAX_WORKERS = 8
+
 # 기술적 지표 계산에 사용하는 기간 파라미터
 _RSI_PERIOD = 14          # RSI 계산 기간 (Wilder's standard)
 _STOCHASTIC_K_PERIOD = 14  # Stochastic %K look-back 기간
@@ -57,6 +181,24 @@ _VOLATILITY_PERIOD = 20    # 변동성 계산에 사용하는 거래일 수
 _PRICE_CHANGE_DAYS = 5     # 최근 수익률 계산 기간
 _TRADING_DAYS_PER_YEAR = 252  # 연환산에 사용하는 연간 거래일 수
 
+# 묶음 다운로드 시 한 요청에 담는 최대 심볼 수
+# 왜 20인가: Yahoo 멀티 심볼 엔드포인트의 심볼 수 한도에 맞춘 값
+_BATCH_CHUNK_SIZE = 20
+
+# 기술적 지표용 가격 데이터 조회 기간
+# 왜 2mo인가: 가장 긴 윈도우가 변동성 20일 + 수익률 경계 정도이고
+# RSI(14)의 Wilder EMA 워밍업을 더해도 거래일 ~42일이면 충분하다.
+# 3mo는 응답 바이트를 거의 2배로 받으면서 결과에 기여하지 않는다.
+_DEFAULT_INDICATOR_PERIOD = "2mo"
+
+# 단건 기술적 지표 TTL 캐시
+# 왜 15분인가: 일봉 기반 지표는 장중에도 거의 변하지 않으므로
+# 재스캔/재시도/크론 겹침에서 같은 티커의 HTTP 재호출을 흡수하기에 충분하다.
+_INDICATOR_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=900)
+
+# 배치 폴백의 병렬 단건 조회가 같은 캐시를 만질 수 있으므로 락으로 보호
+_INDICATOR_CACHE_LOCK = threading.Lock()
+
 
 def get_upcoming_dividends(
     start_date: date | None = None,
@@ -76,22 +218,100 @@ def get_upcoming_dividends(
         ex_dividend_date, dividend_yield, dividend_amount,
         market_cap, current_price, yahoo_finance_url 키가 포함된다.
         API 호출 실패한 종목은 제외된다.
+
+    Note:
+        동일 날짜 범위의 결과는 1시간 TTL로 캐시된다.
+        반환 리스트는 캐시와 공유되므로 호출자가 수정하면 안 된다.
     """
-    results: list[dict[str, Any]] = []
     if start_date is None:
         start_date = date.today()
     if end_date is None:
         end_date = start_date + timedelta(days=_DEFAULT_DAYS_AHEAD)
 
+    # 기본값 해석 이후의 확정된 범위를 캐시 키로 사용한다
+    return _scan_dividend_universe(start_date, end_date)
+
+
+# 동시 스캔 단일 비행(single-flight) 상태: 캐시 키 → 완료 이벤트
+# 왜 필요한가: Bolt 워커 풀에서 같은 범위의 스캔이 거의 동시에 캐시를
+# 두 번 미스하면 50개 × 2벌의 Yahoo 요청이 나간다. 첫 스레드만 조회를
+# 수행하고 나머지는 완료를 기다렸다가 캐시를 다시 읽는다.
+_INFLIGHT_SCANS: dict[Any, threading.Event] = {}
+_INFLIGHT_LOCK = threading.Lock()
+
+
+def _scan_dividend_universe(
+    start_date: date, end_date: date
+) -> list[dict[str, Any]]:
+    """확정된 날짜 범위로 배당 유니버스 전체를 스캔한다 (TTL 캐시).
+
+    동일 키의 동시 호출은 단일 비행으로 합쳐진다: 조회 담당 스레드가
+    실패하면 대기 중이던 스레드 하나가 담당을 이어받아 재시도한다.
+
+    Args:
+        start_date: 스캔 시작일 (포함).
+        end_date: 스캔 종료일 (포함).
+
+    Returns:
+        배당 정보 dict 리스트 (get_upcoming_dividends 참조).
+    """
+    key = hashkey(start_date, end_date)
+    while True:
+        with _DIVIDENDS_CACHE_LOCK:
+            cached_result = _DIVIDENDS_CACHE.get(key)
+        if cached_result is not None:
+            return cached_result
+
+        with _INFLIGHT_LOCK:
+            event = _INFLIGHT_SCANS.get(key)
+            if event is None:
+                # 이 스레드가 조회 담당이 된다
+                event = threading.Event()
+                _INFLIGHT_SCANS[key] = event
+                break
+        # 다른 스레드가 같은 키를 조회 중 — 완료 후 캐시를 재확인
+        event.wait()
+
+    try:
+        results = _do_scan_dividend_universe(start_date, end_date)
+        with _DIVIDENDS_CACHE_LOCK:
+            _DIVIDENDS_CACHE[key] = results
+        return results
+    finally:
+        # 예외로 빠져나가도 대기자들을 깨워 재시도 기회를 준다
+        with _INFLIGHT_LOCK:
+            _INFLIGHT_SCANS.pop(key, None)
+        event.set()
+
+
+def _do_scan_dividend_universe(
+    start_date: date, end_date: date
+) -> list[dict[str, Any]]:
+    """배당 유니버스 스캔의 실제 조회 본체 (캐시/단일 비행 없음).
+
+    Args:
+        start_date: 스캔 시작일 (포함).
+        end_date: 스캔 종료일 (포함).
+
+    Returns:
+        배당 정보 dict 리스트 (get_upcoming_dividends 참조).
+    """
     logger.info(
         "배당락일 스캔 시작: %s ~ %s (%d개 종목)",
         start_date, end_date, len(DIVIDEND_TICKERS),
     )
 
-    for ticker in DIVIDEND_TICKERS:
-        stock_data = _fetch_ticker_dividend_info(ticker, start_date, end_date)
-        if stock_data is not None:
-            results.append(stock_data)
+    # 종목별 조회는 서로 독립적인 네트워크 대기이므로 스레드 풀로
+    # 겹쳐서 수행한다. executor.map이 입력 순서를 보존하므로
+    # 결과 순서는 순차 조회와 동일하다.
+    fetch = functools.partial(
+        _fetch_ticker_dividend_info,
+        start_date=start_date, end_date=end_date,
+    )
+    with ThreadPoolExecutor(max_workers=_FETCH_MAX_WORKERS) as executor:
+        fetched = executor.map(fetch, DIVIDEND_TICKERS)
+
+    results = [data for data in fetched if data is not None]
 
     logger.info("배당락일 스캔 완료: %d개 종목 수집", len(results))
     return results
@@ -119,7 +339,8 @@ def _fetch_ticker_dividend_info(
         호출자에게 예외가 전파되지 않는다.
     """
     try:
-        info = yf.Ticker(ticker).info
+        _YF_RATE_LIMITER.acquire()
+        info = yf.Ticker(ticker, session=_get_yf_session()).info
 
         ex_div_timestamp = info.get("exDividendDate")
         if ex_div_timestamp is None:
@@ -149,9 +370,7 @@ def _fetch_ticker_dividend_info(
             # lastDividendValue: 마지막 실제 배당금(1회분).
             # dividendRate는 연간 합계이므로 1회 낙폭 추정에는 부적합하다.
             "last_dividend_value": info.get("lastDividendValue", 0.0),
-            "yahoo_finance_url": _YAHOO_FINANCE_URL_TEMPLATE.format(
-                ticker=ticker
-            ),
+            "yahoo_finance_url": _yahoo_finance_url(ticker),
         }
     except (KeyError, TypeError, ValueError, OSError) as e:
         # OSError: yfinance 내부의 네트워크/HTTP 오류를 포괄한다
@@ -160,52 +379,171 @@ def _fetch_ticker_dividend_info(
 
 
 def get_technical_indicators(
-    ticker: str, period: str = "3mo"
+    ticker: str, period: str = _DEFAULT_INDICATOR_PERIOD
 ) -> dict[str, Any] | None:
     """단일 종목의 기술적 지표를 계산한다.
 
     yfinance에서 가격 데이터를 가져와 RSI, Stochastic, 변동성 등을
     계산한다. 순수 데이터 수집 + 수학적 계산만 수행하며,
     위험도 판단(HIGH/MEDIUM/LOW) 같은 비즈니스 로직은 포함하지 않는다.
+    성공 결과만 15분 TTL로 메모이즈되어 재스캔/재시도 시
+    같은 티커의 HTTP 재호출을 생략한다 (캐시 키는 대문자 티커 + 기간).
+    None(데이터 부족/일시 장애)은 캐시하지 않아 다음 호출이 재시도한다.
 
     Args:
         ticker: 종목 심볼 (예: "AAPL").
-        period: yfinance 가격 데이터 조회 기간 (기본 "3mo").
-            RSI(14일) + Stochastic(14일) + 변동성(20일) 계산에
-            최소 2개월 이상의 데이터가 필요하므로 3개월을 기본값으로 사용.
+        period: yfinance 가격 데이터 조회 기간 (기본 _DEFAULT_INDICATOR_PERIOD).
+            가장 긴 윈도우(변동성 20일)에 RSI(14)의 Wilder EMA 워밍업을
+            더해도 거래일 ~42일이면 충분하므로 2개월을 기본값으로 사용.
 
     Returns:
         기술적 지표 dict 또는 None (데이터 부족 / API 오류 시).
         dict 키: rsi_14, stochastic_k, stochastic_d,
         volatility_20d, price_change_5d, avg_volume_20d.
     """
+    key = hashkey(ticker.upper(), period)
+    with _INDICATOR_CACHE_LOCK:
+        cached_result = _INDICATOR_CACHE.get(key)
+    if cached_result is not None:
+        return cached_result
+
     try:
-        hist = yf.Ticker(ticker).history(period=period)
-        if hist.empty or len(hist) < _RSI_PERIOD + _STOCHASTIC_K_SMOOTH:
-            logger.warning("종목 %s 가격 데이터 부족 (%d행)", ticker, len(hist))
-            return None
+        _YF_RATE_LIMITER.acquire()
+        hist = yf.Ticker(ticker, session=_get_yf_session()).history(
+            period=period
+        )
+        result = _compute_indicators(hist, ticker)
+    except (KeyError, TypeError, ValueError, OSError) as e:
+        logger.warning("종목 %s 기술적 지표 조회 실패: %s", ticker, e)
+        return None
 
-        close = hist["Close"]
-        volume = hist["Volume"]
+    # 왜 None을 캐시하지 않나: 일시적 네트워크 장애가 TTL 15분 동안
+    # "지표 없음"으로 고정되면 배치 폴백 경로의 재시도 기회가 사라진다
+    if result is not None:
+        with _INDICATOR_CACHE_LOCK:
+            _INDICATOR_CACHE[key] = result
+    return result
 
-        rsi = _calculate_rsi(close)
-        stoch_k, stoch_d = _calculate_stochastic(hist)
-        volatility = _calculate_volatility(close)
-        price_change = _calculate_price_change(close)
-        avg_vol = _calculate_avg_volume(volume)
 
-        return {
-            "rsi_14": round(rsi, 2) if rsi is not None else None,
-            "stochastic_k": round(stoch_k, 2) if stoch_k is not None else None,
-            "stochastic_d": round(stoch_d, 2) if stoch_d is not None else None,
-            "volatility_20d": round(volatility, 2) if volatility is not None else None,
-            "price_change_5d": round(price_change, 2) if price_change is not None else None,
-            "avg_volume_20d": round(avg_vol, 0) if avg_vol is not None else None,
-        }
+def get_technical_indicators_batch(
+    tickers: list[str], period: str = _DEFAULT_INDICATOR_PERIOD
+) -> dict[str, dict[str, Any]]:
+    """여러 종목의 기술적 지표를 묶음 요청으로 계산한다.
+
+    yf.download는 여러 심볼을 한 번의 요청으로 받아오므로
+    종목당 1회씩 HTTP 왕복하는 get_technical_indicators 반복 호출보다
+    네트워크 비용이 크게 줄어든다.
+    Yahoo 멀티 심볼 요청 한도에 맞춰 20개 단위로 분할 요청한다.
+
+    Args:
+        tickers: 종목 심볼 리스트.
+        period: yfinance 가격 데이터 조회 기간 (기본 _DEFAULT_INDICATOR_PERIOD).
+
+    Returns:
+        dict[str, dict[str, Any]]: 티커 → 기술적 지표 dict 매핑.
+            데이터 부족 또는 조회 실패한 티커는 키에서 제외된다.
+    """
+    results: dict[str, dict[str, Any]] = {}
+    for i in range(0, len(tickers), _BATCH_CHUNK_SIZE):
+        chunk = tickers[i:i + _BATCH_CHUNK_SIZE]
+        results.update(_fetch_indicator_chunk(chunk, period))
+    return results
+
+
+def _fetch_indicator_chunk(
+    chunk: list[str], period: str
+) -> dict[str, dict[str, Any]]:
+    """심볼 묶음 하나를 다운로드하여 티커별 지표를 계산한다.
+
+    묶음 다운로드 자체가 실패하면 종목별 단건 조회로 폴백하여
+    일부 종목이라도 지표를 확보한다.
+
+    Args:
+        chunk: 한 번의 요청으로 조회할 심볼 묶음 (최대 20개).
+        period: yfinance 가격 데이터 조회 기간.
+
+    Returns:
+        dict[str, dict[str, Any]]: 티커 → 기술적 지표 dict 매핑.
+    """
+    try:
+        _YF_RATE_LIMITER.acquire()
+        data = yf.download(
+            tickers=chunk,
+            period=period,
+            group_by="ticker",
+            progress=False,
+            threads=True,
+            auto_adjust=True,
+        )
     except (KeyError, TypeError, ValueError, OSError) as e:
-        logger.warning("종목 %s 기술적 지표 조회 실패: %s", ticker, e)
+        logger.warning(
+            "묶음 다운로드 실패 (%d개 종목, 단건 조회로 폴백): %s",
+            len(chunk), e,
+        )
+        fallback: dict[str, dict[str, Any]] = {}
+        for ticker in chunk:
+            indicators = get_technical_indicators(ticker, period=period)
+            if indicators is not None:
+                fallback[ticker] = indicators
+        return fallback
+
+    results: dict[str, dict[str, Any]] = {}
+    multi_column = hasattr(data.columns, "levels")
+    for ticker in chunk:
+        try:
+            # 멀티 심볼 응답은 (티커, 컬럼) MultiIndex,
+            # 단일 심볼 응답은 평탄한 컬럼으로 반환된다
+            hist = data[ticker] if multi_column else data
+            # 상장 기간이 짧은 종목은 앞쪽이 전부 NaN으로 채워진다
+            hist = hist.dropna(how="all")
+            indicators = _compute_indicators(hist, ticker)
+            if indicators is not None:
+                results[ticker] = indicators
+        except (KeyError, TypeError, ValueError) as e:
+            logger.warning("종목 %s 묶음 지표 계산 실패: %s", ticker, e)
+    return results
+
+
+def _compute_indicators(hist: Any, ticker: str) -> dict[str, Any] | None:
+    """가격 DataFrame에서 기술적 지표 dict를 계산한다.
+
+    단건 조회(get_technical_indicators)와 묶음 조회
+    (get_technical_indicators_batch)가 공유하는 계산 코어.
+
+    Args:
+        hist: OHLCV DataFrame (High, Low, Close, Volume 컬럼 필요).
+        ticker: 로깅용 종목 심볼.
+
+    Returns:
+        기술적 지표 dict 또는 None (데이터 부족 시).
+    """
+    if hist.empty or len(hist) < _RSI_PERIOD + _STOCHASTIC_K_SMOOTH:
+        logger.warning("종목 %s 가격 데이터 부족 (%d행)", ticker, len(hist))
         return None
 
+    # 컬럼별 ndarray 추출은 여기서 한 번만 수행하고,
+    # 각 지표 계산은 같은 버퍼 위에서 동작한다
+    # (헬퍼마다 Series 접근/변환을 반복하지 않는다)
+    close = hist["Close"].to_numpy(dtype=np.float64)
+    high = hist["High"].to_numpy(dtype=np.float64)
+    low = hist["Low"].to_numpy(dtype=np.float64)
+    volume = hist["Volume"].to_numpy(dtype=np.float64)
+
+    rsi = _calculate_rsi(close)
+    stoch_k, stoch_d = _calculate_stochastic(high, low, close)
+    volatility = _calculate_volatility(close)
+    price_change = _calculate_price_change(close)
+    avg_vol = _calculate_avg_volume(volume)
+
+    return {
+        "rsi_14": round(rsi, 2) if rsi is not None else None,
+        "stochastic_k": round(stoch_k, 2) if stoch_k is not None else None,
+        "stochastic_d": round(stoch_d, 2) if stoch_d is not None else None,
+        "volatility_20d": round(volatility, 2) if volatility is not None else None,
+        "price_change_5d": round(price_change, 2) if price_change is not None else None,
+        "avg_volume_20d": round(avg_vol, 0) if avg_vol is not None else None,
+    }
+
 
 def _calculate_rsi(close: Any) -> float | None:
     """14일 RSI를 Wilder's smoothing 방식으로 계산한다.
@@ -215,7 +553,7 @@ def _calculate_rsi(close: Any) -> float | None:
     일반 SMA 기반 RSI보다 변동이 부드럽고 추세 반영이 정확하다.
 
     Args:
-        close: pandas Series of closing prices.
+        close: 종가 배열 (ndarray 또는 Series).
 
     Returns:
         RSI 값 (0~100) 또는 None (데이터 부족 시).
@@ -223,30 +561,42 @@ def _calculate_rsi(close: Any) -> float | None:
     if len(close) < _RSI_PERIOD + 1:
         return None
 
+    # pandas diff/clip/ewm은 연산마다 인덱스가 딸린 Series를 새로 만들고
+    # 결국 마지막 원소만 쓰므로, ndarray로 내려가 인덱스 기계를 생략한다
+    arr = np.asarray(close, dtype=np.float64)
+
     # 일간 가격 변동 = 당일 종가 - 전일 종가
-    delta = close.diff()
+    delta = np.diff(arr)
 
     # 상승분(gain)과 하락분(loss) 분리
-    gain = delta.clip(lower=0)
-    loss = (-delta).clip(lower=0)
-
-    # Wilder's smoothing: 첫 N일은 SMA로 시드, 이후 지수이동평균
-    # alpha = 1/N (Wilder 방식). pandas의 EMA에서 alpha=1/N, adjust=False 사용.
-    avg_gain = gain.ewm(alpha=1 / _RSI_PERIOD, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1 / _RSI_PERIOD, adjust=False).mean()
+    gains = np.maximum(delta, 0.0)
+    losses = np.maximum(-delta, 0.0)
+
+    # Wilder's smoothing: alpha = 1/N 의 지수이동평균 (adjust=False 동치).
+    # 점화식이 순차 의존이라 브로드캐스트가 불가능하므로 스칼라 루프로
+    # 마지막 값만 계산한다 (60개 내외 입력에서는 Series 구성보다 싸다)
+    alpha = 1.0 / _RSI_PERIOD
+    beta = 1.0 - alpha
+    avg_gain = gains[0]
+    avg_loss = losses[0]
+    for g, lo in zip(gains[1:].tolist(), losses[1:].tolist()):
+        avg_gain = beta * avg_gain + alpha * g
+        avg_loss = beta * avg_loss + alpha * lo
+
+    if math.isnan(avg_gain) or math.isnan(avg_loss):
+        return None
+    if avg_loss == 0.0:
+        # 하락이 전혀 없으면 RS → ∞: 0/0은 판단 불가(None), 그 외 RSI=100
+        return None if avg_gain == 0.0 else 100.0
 
     # RS = avg_gain / avg_loss
     # RSI = 100 - (100 / (1 + RS))
-    rs = avg_gain / avg_loss
-    rsi = 100 - (100 / (1 + rs))
-
-    last_rsi = rsi.iloc[-1]
-    if math.isnan(last_rsi):
-        return None
-    return float(last_rsi)
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
 
 
-def _calculate_stochastic(hist: Any) -> tuple[float | None, float | None]:
+def _calculate_stochastic(
+    high: Any, low: Any, close: Any
+) -> tuple[float | None, float | None]:
     """스토캐스틱 오실레이터 %K(14,3)와 %D(3)를 계산한다.
 
     %K = SMA( (Close - Low_14) / (High_14 - Low_14) × 100, 3 )
@@ -258,35 +608,54 @@ def _calculate_stochastic(hist: Any) -> tuple[float | None, float | None]:
     - 3: %D의 SMA 기간 (Signal line)
 
     Args:
-        hist: yfinance history DataFrame (High, Low, Close 컬럼 필요).
+        high: 고가 배열 (ndarray 또는 Series).
+        low: 저가 배열 (ndarray 또는 Series).
+        close: 종가 배열 (ndarray 또는 Series).
 
     Returns:
         tuple[float | None, float | None]: (%K, %D) 또는 (None, None).
     """
-    if len(hist) < _STOCHASTIC_K_PERIOD + _STOCHASTIC_K_SMOOTH:
+    if len(close) < _STOCHASTIC_K_PERIOD + _STOCHASTIC_K_SMOOTH:
         return None, None
 
-    high = hist["High"]
-    low = hist["Low"]
-    close = hist["Close"]
+    # 마지막 %K/%D에 기여하는 꼬리 구간만 잘라 계산한다.
+    # 필요한 행 수 = K look-back + %K smoothing + %D 기간 - 2
+    tail = (
+        _STOCHASTIC_K_PERIOD
+        + _STOCHASTIC_K_SMOOTH
+        + _STOCHASTIC_D_PERIOD
+        - 2
+    )
+    high = np.asarray(high, dtype=np.float64)[-tail:]
+    low = np.asarray(low, dtype=np.float64)[-tail:]
+    close = np.asarray(close, dtype=np.float64)[-tail:]
 
-    # 14일 최고가 / 최저가 (rolling window)
-    low_14 = low.rolling(window=_STOCHASTIC_K_PERIOD).min()
-    high_14 = high.rolling(window=_STOCHASTIC_K_PERIOD).max()
+    # 14일 최고가 / 최저가 (sliding window, 행렬 뷰라 복사 없음)
+    low_14 = sliding_window_view(low, _STOCHASTIC_K_PERIOD).min(axis=1)
+    high_14 = sliding_window_view(high, _STOCHASTIC_K_PERIOD).max(axis=1)
 
     # Raw %K = (종가 - 14일 최저) / (14일 최고 - 14일 최저) × 100
     range_14 = high_14 - low_14
-    # 0으로 나누기 방지: 14일간 가격 변동이 없으면 50 (중립) 처리
-    raw_k = ((close - low_14) / range_14.replace(0, float("nan"))) * 100
+    # 0으로 나누기 방지: 14일간 가격 변동이 없으면 NaN 처리
+    range_14 = np.where(range_14 == 0.0, np.nan, range_14)
+    raw_k = (
+        (close[_STOCHASTIC_K_PERIOD - 1:] - low_14) / range_14
+    ) * 100.0
 
     # Slow %K = Raw %K의 3일 SMA (smoothing으로 노이즈 감소)
-    stoch_k = raw_k.rolling(window=_STOCHASTIC_K_SMOOTH).mean()
-    # %D = Slow %K의 3일 SMA (시그널 라인)
-    stoch_d = stoch_k.rolling(window=_STOCHASTIC_D_PERIOD).mean()
-
-    last_k = stoch_k.iloc[-1]
-    last_d = stoch_d.iloc[-1]
+    stoch_k = sliding_window_view(
+        raw_k, _STOCHASTIC_K_SMOOTH
+    ).mean(axis=1)
 
+    # %D = Slow %K의 3일 SMA (시그널 라인)
+    # 데이터가 %D를 만들 만큼은 안 될 수 있다 (%K만 산출 가능한 길이)
+    last_d = np.nan
+    if stoch_k.size >= _STOCHASTIC_D_PERIOD:
+        last_d = sliding_window_view(
+            stoch_k, _STOCHASTIC_D_PERIOD
+        )[-1].mean()
+
+    last_k = stoch_k[-1]
     k_val = None if math.isnan(last_k) else float(last_k)
     d_val = None if math.isnan(last_d) else float(last_d)
     return k_val, d_val
@@ -301,7 +670,7 @@ def _calculate_volatility(close: Any) -> float | None:
     - 20일: 약 1개월 거래일에 해당하며, 단기 변동성 측정에 적합
 
     Args:
-        close: pandas Series of closing prices.
+        close: 종가 배열 (ndarray 또는 Series).
 
     Returns:
         연환산 변동성 (%) 또는 None.
@@ -309,26 +678,29 @@ def _calculate_volatility(close: Any) -> float | None:
     if len(close) < _VOLATILITY_PERIOD + 1:
         return None
 
-    # 일간 수익률 (pct_change = (t - t-1) / t-1)
-    daily_returns = close.pct_change().dropna()
-    if len(daily_returns) < _VOLATILITY_PERIOD:
+    arr = np.asarray(close, dtype=np.float64)
+
+    # 일간 수익률 (pct_change와 동일: (t - t-1) / t-1)
+    daily_returns = arr[1:] / arr[:-1] - 1.0
+    # pandas dropna와 동일하게 NaN 수익률(결측 행 경계)은 제외
+    daily_returns = daily_returns[~np.isnan(daily_returns)]
+    if daily_returns.size < _VOLATILITY_PERIOD:
         return None
 
-    # 최근 20일의 표준편차
-    recent_std = daily_returns.tail(_VOLATILITY_PERIOD).std()
+    # 최근 20일의 표본 표준편차 (pandas std와 동일하게 ddof=1)
+    recent_std = daily_returns[-_VOLATILITY_PERIOD:].std(ddof=1)
     if math.isnan(recent_std):
         return None
 
     # 연환산: 일간 σ × √252 → 연간 σ, × 100으로 퍼센트 변환
-    annualized = float(recent_std) * math.sqrt(_TRADING_DAYS_PER_YEAR) * 100
-    return annualized
+    return float(recent_std) * math.sqrt(_TRADING_DAYS_PER_YEAR) * 100
 
 
 def _calculate_price_change(close: Any) -> float | None:
     """최근 5거래일 수익률을 계산한다.
 
     Args:
-        close: pandas Series of closing prices.
+        close: 종가 배열 (ndarray 또는 Series).
 
     Returns:
         수익률 (%) 또는 None.
@@ -336,8 +708,10 @@ def _calculate_price_change(close: Any) -> float | None:
     if len(close) < _PRICE_CHANGE_DAYS + 1:
         return None
 
-    current = float(close.iloc[-1])
-    past = float(close.iloc[-1 - _PRICE_CHANGE_DAYS])
+    # 필요한 건 스칼라 2개뿐 — 위치 인덱싱으로 바로 꺼낸다
+    arr = np.asarray(close, dtype=np.float64)
+    current = float(arr[-1])
+    past = float(arr[-1 - _PRICE_CHANGE_DAYS])
 
     if past == 0:
         return None
@@ -350,7 +724,7 @@ def _calculate_avg_volume(volume: Any) -> float | None:
     """20일 평균 거래량을 계산한다.
 
     Args:
-        volume: pandas Series of trading volumes.
+        volume: 거래량 배열 (ndarray 또는 Series).
 
     Returns:
         평균 거래량 또는 None.
@@ -358,7 +732,7 @@ def _calculate_avg_volume(volume: Any) -> float | None:
     if len(volume) < _VOLATILITY_PERIOD:
         return None
 
-    avg = volume.tail(_VOLATILITY_PERIOD).mean()
+    avg = np.asarray(volume, dtype=np.float64)[-_VOLATILITY_PERIOD:].mean()
     if math.isnan(avg):
         return None
     return float(avg)
@@ -369,7 +743,7 @@ def _calculate_avg_volume(volume: Any) -> float | None:
 # S&P 100 구성종목 (~102개)
 # 왜 S&P 100인가: 대형주 전체를 커버하면서도 API 호출 수가 합리적인 수준.
 # 실적 시즌에 시장 영향이 큰 종목들을 빠짐없이 포착한다.
-EARNINGS_TICKERS: list[str] = [
+EARNINGS_TICKERS: tuple[str, ...] = (
     "AAPL", "ABBV", "ABT", "ACN", "ADBE", "AIG", "AMD", "AMGN", "AMZN", "AVGO",
     "AXP", "BA", "BAC", "BK", "BKNG", "BLK", "BMY", "BRK-B", "C", "CAT",
     "CHTR", "CL", "CMCSA", "COF", "COP", "COST", "CRM", "CSCO", "CVS", "CVX",
@@ -381,11 +755,18 @@ EARNINGS_TICKERS: list[str] = [
     "QCOM", "RTX", "SBUX", "SCHW", "SO", "SPG", "T", "TGT", "TMO", "TMUS",
     "TSLA", "TXN", "UNH", "UNP", "UPS", "USB", "V", "VZ", "WBA", "WFC",
     "WMT", "XOM",
-]
+)
 
 # 실적발표 스캔 기본 범위 (일)
 _DEFAULT_EARNINGS_DAYS_AHEAD = 14
 
+# 고정 유니버스 티커의 종목 페이지 URL (모듈 로드 시 1회 생성)
+# 조회 결과마다 str.format의 템플릿 파싱을 반복하지 않기 위함이다
+_YAHOO_FINANCE_URLS: dict[str, str] = {
+    t: _YAHOO_FINANCE_URL_TEMPLATE.format(ticker=t)
+    for t in (*DIVIDEND_TICKERS, *EARNINGS_TICKERS)
+}
+
 
 def get_upcoming_earnings(
     start_date: date | None = None,
@@ -449,7 +830,8 @@ def _fetch_ticker_earnings_info(
         호출자에게 예외가 전파되지 않는다.
     """
     try:
-        ticker_obj = yf.Ticker(ticker)
+        _YF_RATE_LIMITER.acquire()
+        ticker_obj = yf.Ticker(ticker, session=_get_yf_session())
         cal = ticker_obj.calendar
 
         # calendar가 없거나 빈 경우 스킵
@@ -508,9 +890,7 @@ def _fetch_ticker_earnings_info(
             "last_eps_actual": surprise_data.get("last_eps_actual"),
             "last_eps_estimate": surprise_data.get("last_eps_estimate"),
             "last_surprise_pct": surprise_data.get("last_surprise_pct"),
-            "yahoo_finance_url": _YAHOO_FINANCE_URL_TEMPLATE.format(
-                ticker=ticker
-            ),
+            "yahoo_finance_url": _yahoo_finance_url(ticker),
         }
     except (KeyError, TypeError, ValueError, OSError, AttributeError) as e:
         logger.warning("종목 %s 실적발표 데이터 수집 실패: %s", ticker, e)
@@ -617,6 +997,8 @@ def _fetch_last_earnings_surprise(
         "last_surprise_pct": None,
     }
     try:
+        # calendar와 별개의 HTTP 요청이므로 토큰을 따로 소비한다
+        _YF_RATE_LIMITER.acquire()
         earnings_dates = ticker_obj.get_earnings_dates(limit=4)
         if earnings_dates is None or earnings_dates.empty:
             return empty_result
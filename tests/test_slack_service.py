@@ -28,6 +28,16 @@ def _make_config() -> SlackConfig:
     )
 
 
+@pytest.fixture(autouse=True)
+def _mock_external_scans(mock_digest_scans: None) -> None:
+    """모든 테스트에서 배당/실적/금리 수집 도구를 mock으로 고정한다.
+
+    run_digest()는 실제로 호출하면 레이트 리미터를 거치는 외부 API
+    호출 수백 건을 만들어 테스트당 수십 초를 소모한다. 이 모듈은
+    SlackService의 실행 흐름만 검증하므로 도구 경계를 통째로 대체한다.
+    """
+
+
 class TestSlackServiceRunDigest:
     """SlackService.run_digest() 테스트."""
 
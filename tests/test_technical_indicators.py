@@ -11,6 +11,7 @@ import pandas as pd
 import pytest
 
 from src.tools.yahoo_finance import (
+    _INDICATOR_CACHE,
     _calculate_avg_volume,
     _calculate_price_change,
     _calculate_rsi,
@@ -136,7 +137,9 @@ class TestCalculateStochastic:
         close = [100 + i * 0.5 for i in range(n)]
         hist = self._make_ohlc_df(high, low, close)
 
-        k, d = _calculate_stochastic(hist)
+        k, d = _calculate_stochastic(
+            hist["High"], hist["Low"], hist["Close"]
+        )
 
         assert k is not None and d is not None
         assert 0 <= k <= 100
@@ -151,7 +154,9 @@ class TestCalculateStochastic:
         close = [100 + i * 2 for i in range(n)]
         hist = self._make_ohlc_df(high, low, close)
 
-        k, d = _calculate_stochastic(hist)
+        k, d = _calculate_stochastic(
+            hist["High"], hist["Low"], hist["Close"]
+        )
 
         assert k is not None
         # 상승 추세에서 종가가 항상 최고가 근처이므로 %K가 높아야 함
@@ -163,7 +168,9 @@ class TestCalculateStochastic:
             [100] * 10, [99] * 10, [99.5] * 10,
         )
 
-        k, d = _calculate_stochastic(hist)
+        k, d = _calculate_stochastic(
+            hist["High"], hist["Low"], hist["Close"]
+        )
 
         assert k is None
         assert d is None
@@ -268,6 +275,11 @@ class TestCalculateAvgVolume:
 class TestGetTechnicalIndicators:
     """get_technical_indicators() 통합 테스트."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_indicator_cache(self) -> None:
+        """테스트 간 TTL 메모이즈 캐시 간섭을 방지한다."""
+        _INDICATOR_CACHE.clear()
+
     @patch("src.tools.yahoo_finance.yf.Ticker")
     def test_returns_all_indicators(
         self, mock_ticker_cls: MagicMock
@@ -8,8 +8,12 @@ from datetime import date, timedelta
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from src.tools.yahoo_finance import (
     DIVIDEND_TICKERS,
+    _DIVIDENDS_CACHE,
+    _YF_RATE_LIMITER,
     _fetch_ticker_dividend_info,
     get_upcoming_dividends,
 )
@@ -59,6 +63,14 @@ def _make_yfinance_info(
 class TestGetUpcomingDividends:
     """get_upcoming_dividends() 테스트."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_dividends_cache(self) -> None:
+        """테스트 간 TTL 캐시/레이트리미터 간섭을 방지한다."""
+        _DIVIDENDS_CACHE.clear()
+        # 스캔 1회가 토큰 54개를 소비하므로 매 테스트 전 가득 채워
+        # 앞선 테스트 때문에 스로틀 대기가 생기지 않게 한다
+        _YF_RATE_LIMITER.reset()
+
     @patch("src.tools.yahoo_finance.yf.Ticker")
     def test_returns_stocks_in_range(
         self, mock_ticker_cls: MagicMock